@@ -17,12 +17,16 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
-import statistics
+from typing import Any, Callable, Dict, Final, List, Literal, Optional, Sequence, Tuple
+import asyncio
+import functools
 import math
 import random
+import time
 
+import numpy as np
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 
@@ -30,6 +34,11 @@ from pydantic import BaseModel, Field
 # Models
 # =============================================================================
 
+Period = Literal["1h", "6h", "24h", "7d", "30d"]
+
+_HOURS_MAP: Final[Dict[str, int]] = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
+
+
 class RiskLevel(str, Enum):
     EASY = "easy"
     MEDIUM = "medium"
@@ -138,20 +147,95 @@ class GridGameStatistics(BaseModel):
     lane_analysis: Optional[ChickenRoadLaneAnalysis] = None  # Chicken Road
 
 
+# =============================================================================
+# Columnar Round Data
+# =============================================================================
+
+# Rounds columns read by _to_columns for analyze_tiles, in positional order
+# (tiles, multiplier, is_win) with the fallbacks already applied in SQL
+_TILE_COLUMNS = (
+    "COALESCE(tiles_opened, steps, 0), "
+    "COALESCE(multiplier, 1.0), "
+    "COALESCE(is_win, cashout, 0)"
+)
+
+# Risk level encoding (-1 marks an unknown level)
+_RISK_LEVEL_CODES: Dict[str, int] = {"easy": 0, "medium": 1, "hard": 2, "extreme": 3}
+
+# Towers choice encoding (index into per-choice tallies)
+_CHOICE_CODES: Dict[str, int] = {"left": 0, "middle": 1, "right": 2}
+
+# Mines position categories (5x5 grid)
+_CORNERS = np.zeros(25, dtype=np.bool_)
+_CORNERS[[0, 4, 20, 24]] = True
+_EDGES = np.zeros(25, dtype=np.bool_)
+_EDGES[[1, 2, 3, 5, 9, 10, 14, 15, 19, 21, 22, 23]] = True
+_CENTER = np.zeros(25, dtype=np.bool_)
+_CENTER[[6, 7, 8, 11, 12, 13, 16, 17, 18]] = True
+
+
+@dataclass
+class RoundColumns:
+    """Round data stored as one array per field (struct-of-arrays)."""
+    tiles: np.ndarray
+    multiplier: np.ndarray
+    is_win: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.tiles)
+
+
+def _to_columns(rows: Sequence[Sequence[Any]]) -> RoundColumns:
+    """Convert rows selected with _TILE_COLUMNS to RoundColumns by position."""
+    n = len(rows)
+    tiles = np.empty(n, dtype=np.int32)
+    multiplier = np.empty(n, dtype=np.float64)
+    is_win = np.empty(n, dtype=np.bool_)
+
+    for i, row in enumerate(rows):
+        tiles[i] = row[0]
+        multiplier[i] = row[1]
+        is_win[i] = bool(row[2])
+
+    return RoundColumns(tiles=tiles, multiplier=multiplier, is_win=is_win)
+
+
 # =============================================================================
 # Calculator
 # =============================================================================
 
+def _count_flagged(flags: np.ndarray, mask: np.ndarray) -> int:
+    """Count rows set in both boolean arrays flags and mask."""
+    return int(np.count_nonzero(flags & mask))
+
+
+def _histogram_arrays(rows: Sequence[Sequence[Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Split (value, count) rows into value and count arrays."""
+    values = np.array([row[0] for row in rows], dtype=np.int64)
+    counts = np.array([row[1] for row in rows], dtype=np.int64)
+    return values, counts
+
+
+def _reached_counts(
+    values: np.ndarray,
+    max_value: int,
+    weights: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Count values >= k for every k in 0..max_value + 1 (index k)."""
+    counts = np.bincount(values.clip(0, max_value + 1), weights=weights, minlength=max_value + 2)
+    return counts[::-1].cumsum()[::-1].astype(np.int64)
+
+
 class GridGameCalculator:
     """Calculates grid game specific statistics."""
 
     def analyze_tiles(
         self,
-        rounds: List[Dict],
+        cols: RoundColumns,
     ) -> TileAnalysis:
         """Analyze tile/step data."""
-        if not rounds:
-            return TileAnalysis(
+        if not cols:
+            return TileAnalysis.model_construct(
                 total_rounds=0,
                 avg_tiles_opened=0,
                 avg_multiplier=0,
@@ -164,28 +248,34 @@ class GridGameCalculator:
                 avg_tiles_before_fail=0,
             )
 
-        n = len(rounds)
-        tiles = [r.get('tiles_opened', r.get('steps', 0)) for r in rounds]
-        multipliers = [r.get('multiplier', 1.0) for r in rounds]
-        is_win = [r.get('is_win', r.get('cashout', False)) for r in rounds]
+        n = len(cols)
+        tiles = cols.tiles
+        multipliers = cols.multiplier
+        is_win = cols.is_win
 
-        avg_tiles = statistics.mean(tiles) if tiles else 0
-        avg_mult = statistics.mean(multipliers) if multipliers else 0
-        med_tiles = statistics.median(tiles) if tiles else 0
-        max_tiles = max(tiles) if tiles else 0
+        avg_tiles = float(tiles.mean())
+        avg_mult = float(multipliers.mean())
+        med_tiles = float(np.median(tiles))
+        max_tiles = int(tiles.max())
 
         # Cashout patterns (for wins only)
-        wins = [t for t, w in zip(tiles, is_win) if w]
-        early = sum(1 for t in wins if t <= 3) / len(wins) * 100 if wins else 0
-        mid = sum(1 for t in wins if 4 <= t <= 7) / len(wins) * 100 if wins else 0
-        late = sum(1 for t in wins if t >= 8) / len(wins) * 100 if wins else 0
+        win_count = np.count_nonzero(is_win)
+        if win_count:
+            early = _count_flagged(is_win, tiles <= 3) / win_count * 100
+            mid = _count_flagged(is_win, (tiles >= 4) & (tiles <= 7)) / win_count * 100
+            late = _count_flagged(is_win, tiles >= 8) / win_count * 100
+        else:
+            early = mid = late = 0
 
         # Failure patterns
-        fails = [t for t, w in zip(tiles, is_win) if not w]
-        first_fail = sum(1 for t in fails if t == 1) / len(fails) * 100 if fails else 0
-        avg_fail_tiles = statistics.mean(fails) if fails else 0
-
-        return TileAnalysis(
+        fail_count = n - win_count
+        if fail_count:
+            first_fail = _count_flagged(~is_win, tiles == 1) / fail_count * 100
+            avg_fail_tiles = float(tiles[~is_win].mean())
+        else:
+            first_fail = avg_fail_tiles = 0
+
+        return TileAnalysis.model_construct(
             total_rounds=n,
             avg_tiles_opened=round(avg_tiles, 2),
             avg_multiplier=round(avg_mult, 4),
@@ -198,42 +288,36 @@ class GridGameCalculator:
             avg_tiles_before_fail=round(avg_fail_tiles, 2),
         )
 
-    def analyze_mine_positions(
+    def heatmap_from_counts(
         self,
-        rounds: List[Dict],
-        grid_size: int = 25,
+        position_counts: np.ndarray,
     ) -> PositionHeatmap:
-        """Analyze mine positions for Mines game."""
-        position_counts = {i: 0 for i in range(grid_size)}
-        total_mines = 0
-
-        for round_data in rounds:
-            mines = round_data.get('mine_positions', [])
-            for pos in mines:
-                if 0 <= pos < grid_size:
-                    position_counts[pos] += 1
-                    total_mines += 1
+        """Build the mine position heatmap from per-position mine counts."""
+        grid_size = len(position_counts)
+        total_mines = int(position_counts.sum())
 
         # Calculate frequencies
-        frequencies = {}
-        for pos, count in position_counts.items():
-            frequencies[pos] = round(count / total_mines * 100, 2) if total_mines > 0 else 0
-
-        # Define position categories (for 5x5 grid)
-        corners = [0, 4, 20, 24]
-        edges = [1, 2, 3, 5, 9, 10, 14, 15, 19, 21, 22, 23]
-        center = [6, 7, 8, 11, 12, 13, 16, 17, 18]
+        if total_mines > 0:
+            frequencies = dict(enumerate(
+                np.round(position_counts / total_mines * 100, 2).tolist()
+            ))
+        else:
+            frequencies = {pos: 0 for pos in range(grid_size)}
 
-        corner_rate = sum(position_counts[p] for p in corners) / total_mines * 100 if total_mines > 0 else 0
-        edge_rate = sum(position_counts[p] for p in edges) / total_mines * 100 if total_mines > 0 else 0
-        center_rate = sum(position_counts[p] for p in center) / total_mines * 100 if total_mines > 0 else 0
+        # Position categories (for 5x5 grid)
+        if total_mines > 0:
+            corner_rate = position_counts[_CORNERS].sum() / total_mines * 100
+            edge_rate = position_counts[_EDGES].sum() / total_mines * 100
+            center_rate = position_counts[_CENTER].sum() / total_mines * 100
+        else:
+            corner_rate = edge_rate = center_rate = 0
 
         # Find safest/riskiest
-        sorted_positions = sorted(position_counts.items(), key=lambda x: x[1])
-        safest = [p[0] for p in sorted_positions[:5]]
-        riskiest = [p[0] for p in sorted_positions[-5:]]
+        sorted_positions = np.argsort(position_counts, kind='stable')
+        safest = sorted_positions[:5].tolist()
+        riskiest = sorted_positions[-5:].tolist()
 
-        return PositionHeatmap(
+        return PositionHeatmap.model_construct(
             grid_size=grid_size,
             mine_count_analyzed=total_mines,
             corner_mine_rate=round(corner_rate, 2),
@@ -244,20 +328,16 @@ class GridGameCalculator:
             riskiest_positions=riskiest,
         )
 
-    def analyze_risk_levels(
+    def risk_levels_from_aggregates(
         self,
-        rounds: List[Dict],
+        aggregates: Sequence[Sequence[Any]],
     ) -> List[RiskLevelStats]:
-        """Analyze statistics by risk level."""
-        risk_data: Dict[str, List[Dict]] = {
-            "easy": [], "medium": [], "hard": [], "extreme": []
-        }
-
-        for r in rounds:
-            level = r.get('risk_level', 'medium').lower()
-            if level in risk_data:
-                risk_data[level].append(r)
+        """
+        Build risk level statistics from per-level aggregates.
 
+        Each aggregate is (risk_level, rounds, avg_multiplier, wins,
+        big_wins, avg_tiles). Unknown levels are ignored.
+        """
         # Theoretical RTPs by risk level
         theoretical_rtps = {
             "easy": 98.0,
@@ -266,35 +346,49 @@ class GridGameCalculator:
             "extreme": 95.0,
         }
 
+        by_level = {row[0]: row for row in aggregates}
+
         results = []
-        for level, data in risk_data.items():
-            if not data:
+        for level in _RISK_LEVEL_CODES:
+            row = by_level.get(level)
+            if row is None or not row[1]:
                 continue
 
-            multipliers = [d.get('multiplier', 1.0) for d in data]
-            tiles = [d.get('tiles_opened', d.get('steps', 0)) for d in data]
-            wins = [d for d in data if d.get('is_win', False)]
+            _, level_rounds, avg_mult, wins, big_wins, avg_tiles = row
 
-            results.append(RiskLevelStats(
+            results.append(RiskLevelStats.model_construct(
                 risk_level=level,
-                total_rounds=len(data),
-                avg_multiplier=round(statistics.mean(multipliers), 4) if multipliers else 0,
-                success_rate=round(len(wins) / len(data) * 100, 2) if data else 0,
-                big_win_rate=round(sum(1 for m in multipliers if m >= 5) / len(multipliers) * 100, 2) if multipliers else 0,
-                avg_tiles_opened=round(statistics.mean(tiles), 2) if tiles else 0,
+                total_rounds=level_rounds,
+                avg_multiplier=round(avg_mult, 4),
+                success_rate=round(wins / level_rounds * 100, 2),
+                big_win_rate=round(big_wins / level_rounds * 100, 2),
+                avg_tiles_opened=round(avg_tiles, 2),
                 theoretical_rtp=theoretical_rtps.get(level, 97.0),
             ))
 
         return results
 
-    def analyze_towers_floors(
+    def floors_from_histogram(
         self,
-        rounds: List[Dict],
+        floors: np.ndarray,
+        counts: np.ndarray,
+        choice_totals: np.ndarray,
+        choice_wins: np.ndarray,
         max_floors: int = 10,
     ) -> TowersFloorAnalysis:
-        """Analyze Towers floor data."""
-        if not rounds:
-            return TowersFloorAnalysis(
+        """
+        Build Towers floor analysis from a floor histogram.
+
+        Args:
+            floors: Floor values reached.
+            counts: Number of rounds for each entry in floors.
+            choice_totals: Picks per choice (left, middle, right).
+            choice_wins: Successful picks per choice (left, middle, right).
+            max_floors: Number of floors in the tower.
+        """
+        n = int(counts.sum())
+        if not n:
+            return TowersFloorAnalysis.model_construct(
                 total_rounds=0,
                 max_floor_reached=0,
                 avg_floor_reached=0,
@@ -306,65 +400,58 @@ class GridGameCalculator:
                 expected_value_per_floor={},
             )
 
-        floors = [r.get('floor_reached', r.get('steps', 0)) for r in rounds]
-        choices = [r.get('choices', []) for r in rounds]
-
-        avg_floor = statistics.mean(floors)
-        max_floor = max(floors)
+        avg_floor = float(np.average(floors, weights=counts))
+        max_floor = int(floors[counts > 0].max())
 
         # Floor success rates
-        floor_rates = {}
-        for floor in range(1, max_floors + 1):
-            reached = sum(1 for f in floors if f >= floor)
-            floor_rates[floor] = round(reached / len(floors) * 100, 2)
-
-        # Choice analysis (aggregate all choices)
-        all_choices = []
-        all_results = []
-        for r in rounds:
-            ch = r.get('choices', [])
-            res = r.get('choice_results', [])
-            all_choices.extend(ch)
-            all_results.extend(res)
-
-        left_wins = sum(1 for c, r in zip(all_choices, all_results) if c == 'left' and r)
-        left_total = sum(1 for c in all_choices if c == 'left')
-        mid_wins = sum(1 for c, r in zip(all_choices, all_results) if c == 'middle' and r)
-        mid_total = sum(1 for c in all_choices if c == 'middle')
-        right_wins = sum(1 for c, r in zip(all_choices, all_results) if c == 'right' and r)
-        right_total = sum(1 for c in all_choices if c == 'right')
+        reached = _reached_counts(floors, max_floors, counts)
+        floor_rates_arr = np.round(reached[1:max_floors + 1] / n * 100, 2)
+        floor_rates = dict(zip(range(1, max_floors + 1), floor_rates_arr.tolist()))
+
+        # Choice analysis (aggregate all choices, paired with their results)
+        choice_rates = [
+            round(float(wins / total * 100), 2) if total > 0 else 33.33
+            for wins, total in zip(choice_wins, choice_totals)
+        ]
 
         # Expected value per floor (simplified)
-        ev_per_floor = {}
-        base_mult = 1.0
-        for floor in range(1, max_floors + 1):
-            success_rate = floor_rates.get(floor, 0) / 100
-            base_mult *= 1.5  # Approximate multiplier increase
-            ev_per_floor[floor] = round(success_rate * base_mult, 4)
+        floor_numbers = np.arange(1, max_floors + 1)
+        # Approximate multiplier increase
+        ev = np.round(floor_rates_arr / 100 * 1.5 ** floor_numbers, 4)
+        ev_per_floor = dict(zip(range(1, max_floors + 1), ev.tolist()))
 
         # Find recommended stop (highest EV)
-        recommended = max(ev_per_floor.items(), key=lambda x: x[1])[0] if ev_per_floor else 3
+        recommended = int(np.argmax(ev)) + 1 if ev.size else 3
 
-        return TowersFloorAnalysis(
-            total_rounds=len(rounds),
+        return TowersFloorAnalysis.model_construct(
+            total_rounds=n,
             max_floor_reached=max_floor,
             avg_floor_reached=round(avg_floor, 2),
             floor_success_rates=floor_rates,
-            left_success_rate=round(left_wins / left_total * 100, 2) if left_total > 0 else 33.33,
-            middle_success_rate=round(mid_wins / mid_total * 100, 2) if mid_total > 0 else 33.33,
-            right_success_rate=round(right_wins / right_total * 100, 2) if right_total > 0 else 33.33,
+            left_success_rate=choice_rates[0],
+            middle_success_rate=choice_rates[1],
+            right_success_rate=choice_rates[2],
             recommended_stop_floor=recommended,
             expected_value_per_floor=ev_per_floor,
         )
 
-    def analyze_chicken_road_lanes(
+    def lanes_from_histogram(
         self,
-        rounds: List[Dict],
+        distances: np.ndarray,
+        counts: np.ndarray,
         total_lanes: int = 10,
     ) -> ChickenRoadLaneAnalysis:
-        """Analyze Chicken Road lane data."""
-        if not rounds:
-            return ChickenRoadLaneAnalysis(
+        """
+        Build Chicken Road lane analysis from a distance histogram.
+
+        Args:
+            distances: Lanes crossed.
+            counts: Number of rounds for each entry in distances.
+            total_lanes: Number of lanes on the road.
+        """
+        n = int(counts.sum())
+        if not n:
+            return ChickenRoadLaneAnalysis.model_construct(
                 total_rounds=0,
                 avg_distance=0,
                 max_distance=0,
@@ -375,32 +462,25 @@ class GridGameCalculator:
                 completed_rate=0,
             )
 
-        distances = [r.get('lanes_crossed', r.get('distance', 0)) for r in rounds]
-
-        avg_dist = statistics.mean(distances)
-        max_dist = max(distances)
+        avg_dist = float(np.average(distances, weights=counts))
+        max_dist = int(distances[counts > 0].max())
 
         # Lane success rates
-        lane_rates = {}
-        for lane in range(1, total_lanes + 1):
-            reached = sum(1 for d in distances if d >= lane)
-            lane_rates[lane] = round(reached / len(distances) * 100, 2)
+        reached = _reached_counts(distances, total_lanes, counts)
+        lane_rates_arr = np.round(reached[1:total_lanes + 1] / n * 100, 2)
+        lane_rates = dict(zip(range(1, total_lanes + 1), lane_rates_arr.tolist()))
 
         # Find dangerous/safe lanes (biggest drop in success rate)
-        danger_drops = {}
-        for lane in range(2, total_lanes + 1):
-            drop = lane_rates.get(lane - 1, 0) - lane_rates.get(lane, 0)
-            danger_drops[lane] = drop
-
-        most_dangerous = max(danger_drops.items(), key=lambda x: x[1])[0] if danger_drops else 1
-        safest = min(danger_drops.items(), key=lambda x: x[1])[0] if danger_drops else 1
+        drops = lane_rates_arr[:-1] - lane_rates_arr[1:]
+        most_dangerous = int(np.argmax(drops)) + 2 if drops.size else 1
+        safest = int(np.argmin(drops)) + 2 if drops.size else 1
 
         # Early catch rate
-        early_caught = sum(1 for d in distances if d <= 3) / len(distances) * 100
-        completed = sum(1 for d in distances if d >= total_lanes) / len(distances) * 100
+        early_caught = counts[distances <= 3].sum() / n * 100
+        completed = float(reached[total_lanes]) / n * 100
 
-        return ChickenRoadLaneAnalysis(
-            total_rounds=len(rounds),
+        return ChickenRoadLaneAnalysis.model_construct(
+            total_rounds=n,
             avg_distance=round(avg_dist, 2),
             max_distance=max_dist,
             lane_success_rates=lane_rates,
@@ -411,6 +491,57 @@ class GridGameCalculator:
         )
 
 
+# =============================================================================
+# Caching
+# =============================================================================
+
+def async_ttl_cache(ttl_seconds: float = 30, maxsize: int = 64) -> Callable:
+    """
+    Memoize an async service method per (game, game_type, *args, **kwargs).
+
+    Results are reused for ttl_seconds. Concurrent misses for the same key
+    wait on one lock so only the first caller hits the database.
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+        locks: Dict[Tuple, asyncio.Lock] = {}
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = (self.game, self.game_type, *args, *sorted(kwargs.items()))
+            entry = cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            lock = locks.get(key)
+            if lock is None:
+                lock = locks[key] = asyncio.Lock()
+            async with lock:
+                entry = cache.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    return entry[1]
+
+                result = await func(self, *args, **kwargs)
+
+                if key not in cache and len(cache) >= maxsize:
+                    now = time.monotonic()
+                    for stale in [k for k, (expiry, _) in cache.items() if expiry <= now]:
+                        del cache[stale]
+                    if len(cache) >= maxsize:
+                        del cache[next(iter(cache))]
+                cache[key] = (time.monotonic() + ttl_seconds, result)
+                return result
+
+        def cache_clear() -> None:
+            cache.clear()
+            locks.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
 # =============================================================================
 # Service
 # =============================================================================
@@ -424,56 +555,238 @@ class GridGameStatsService:
         self.game_type = game_type
         self.calculator = GridGameCalculator()
 
+    def _period_filter(self, hours: Optional[int]) -> Tuple[str, List[Any]]:
+        """Build the created_at WHERE clause and its parameters."""
+        if not hours:
+            return "", []
+        cutoff = datetime.utcnow() - timedelta(hours=hours)
+        return " WHERE created_at >= ?", [cutoff]
+
+    async def _fetch(self, query: str, params: List[Any]) -> List[Any]:
+        """Run a query on a pooled connection and return its rows."""
+        async with self.db_pool.acquire() as conn:
+            return await conn.fetch(query, *params)
+
+    def _rounds_query(
+        self,
+        hours: Optional[int] = None,
+        limit: Optional[int] = None,
+        columns: str = "*",
+    ) -> Tuple[str, List[Any]]:
+        """
+        Build the rounds query and its parameters.
+
+        The created_at filter and ordering expect an index on
+        rounds(created_at DESC) (idx_rounds_created_at).
+        """
+        where, params = self._period_filter(hours)
+        query = f"SELECT {columns} FROM rounds{where} ORDER BY created_at DESC"
+
+        if limit:
+            query += " LIMIT ?"
+            params.append(int(limit))
+
+        return query, params
+
     async def get_rounds(
         self,
         hours: Optional[int] = None,
         limit: Optional[int] = None,
     ) -> List[Dict]:
         """Fetch rounds from database."""
-        query = "SELECT * FROM rounds"
-        params = []
+        query, params = self._rounds_query(hours, limit)
+        rows = await self._fetch(query, params)
+        return [dict(row) for row in rows]
 
-        if hours:
-            cutoff = datetime.utcnow() - timedelta(hours=hours)
-            query += " WHERE created_at >= ?"
-            params.append(cutoff)
+    async def get_rounds_columns(
+        self,
+        hours: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> RoundColumns:
+        """Fetch the analyze_tiles columns straight into column arrays."""
+        query, params = self._rounds_query(hours, limit, _TILE_COLUMNS)
+        rows = await self._fetch(query, params)
+        return _to_columns(rows)
+
+    async def get_risk_aggregates(self, hours: Optional[int] = None) -> List[Tuple]:
+        """
+        Aggregate rounds per risk level in SQL.
+
+        Returns:
+            (risk_level, rounds, avg_multiplier, wins, big_wins, avg_tiles) rows.
+        """
+        where, params = self._period_filter(hours)
+        rows = await self._fetch(
+            f"""
+            SELECT LOWER(COALESCE(risk_level, 'medium')) AS level,
+                   COUNT(*),
+                   AVG(COALESCE(multiplier, 1.0)),
+                   SUM(CASE WHEN COALESCE(is_win, cashout, 0) THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN COALESCE(multiplier, 1.0) >= 5 THEN 1 ELSE 0 END),
+                   AVG(COALESCE(tiles_opened, steps, 0))
+            FROM rounds{where}
+            GROUP BY level
+            """,
+            params,
+        )
+        return [tuple(row) for row in rows]
 
-        query += " ORDER BY created_at DESC"
+    async def get_floor_histogram(
+        self,
+        hours: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Count rounds per floor reached (Towers) in SQL."""
+        where, params = self._period_filter(hours)
+        rows = await self._fetch(
+            f"""
+            SELECT COALESCE(floor_reached, steps, 0) AS floor, COUNT(*)
+            FROM rounds{where}
+            GROUP BY floor
+            """,
+            params,
+        )
+        return _histogram_arrays(rows)
 
-        if limit:
-            query += f" LIMIT {limit}"
+    async def get_lane_histogram(
+        self,
+        hours: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Count rounds per lanes crossed (Chicken Road) in SQL."""
+        where, params = self._period_filter(hours)
+        rows = await self._fetch(
+            f"""
+            SELECT COALESCE(lanes_crossed, distance, 0) AS lanes, COUNT(*)
+            FROM rounds{where}
+            GROUP BY lanes
+            """,
+            params,
+        )
+        return _histogram_arrays(rows)
 
-        async with self.db_pool.acquire() as conn:
-            rows = await conn.fetch(query, *params)
-            return [dict(row) for row in rows]
+    async def get_choice_tallies(
+        self,
+        hours: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Count picks and successful picks per Towers choice in SQL.
+
+        Returns:
+            (totals, wins) arrays indexed left, middle, right.
+        """
+        where, params = self._period_filter(hours)
+        rows = await self._fetch(
+            f"""
+            SELECT c.value AS choice,
+                   COUNT(*),
+                   SUM(CASE WHEN r.value THEN 1 ELSE 0 END)
+            FROM rounds
+            JOIN json_each(rounds.choices) AS c
+            JOIN json_each(rounds.choice_results) AS r ON r.key = c.key{where}
+            GROUP BY choice
+            """,
+            params,
+        )
+        totals = np.zeros(3, dtype=np.int64)
+        wins = np.zeros(3, dtype=np.int64)
+        for row in rows:
+            code = _CHOICE_CODES.get(row[0])
+            if code is not None:
+                totals[code] = row[1]
+                wins[code] = row[2]
+        return totals, wins
+
+    async def get_mine_position_counts(
+        self,
+        hours: Optional[int] = None,
+        grid_size: int = 25,
+    ) -> np.ndarray:
+        """Count mines per grid position (Mines) in SQL."""
+        where, params = self._period_filter(hours)
+        rows = await self._fetch(
+            f"""
+            SELECT CAST(p.value AS INTEGER) AS pos, COUNT(*)
+            FROM rounds
+            JOIN json_each(rounds.mine_positions) AS p{where}
+            GROUP BY pos
+            """,
+            params,
+        )
+        counts = np.zeros(grid_size, dtype=np.int64)
+        for row in rows:
+            if row[0] is not None and 0 <= row[0] < grid_size:
+                counts[row[0]] = row[1]
+        return counts
+
+    async def _tile_analysis(self, hours: Optional[int]) -> TileAnalysis:
+        """Build the tile analysis from raw rows (the median needs every value)."""
+        cols = await self.get_rounds_columns(hours=hours)
+        return await asyncio.to_thread(self.calculator.analyze_tiles, cols)
+
+    async def _risk_comparison(self, hours: Optional[int]) -> List[RiskLevelStats]:
+        """Build the risk level comparison from SQL aggregates."""
+        aggregates = await self.get_risk_aggregates(hours)
+        return self.calculator.risk_levels_from_aggregates(aggregates)
+
+    async def _position_heatmap(self, hours: Optional[int]) -> PositionHeatmap:
+        """Build the mine position heatmap from SQL aggregates."""
+        counts = await self.get_mine_position_counts(hours)
+        return self.calculator.heatmap_from_counts(counts)
+
+    async def _floor_analysis(self, hours: Optional[int]) -> TowersFloorAnalysis:
+        """Build the Towers floor analysis from SQL aggregates."""
+        (floors, counts), (choice_totals, choice_wins) = await asyncio.gather(
+            self.get_floor_histogram(hours),
+            self.get_choice_tallies(hours),
+        )
+        return self.calculator.floors_from_histogram(floors, counts, choice_totals, choice_wins)
+
+    async def _lane_analysis(self, hours: Optional[int]) -> ChickenRoadLaneAnalysis:
+        """Build the Chicken Road lane analysis from SQL aggregates."""
+        distances, counts = await self.get_lane_histogram(hours)
+        return self.calculator.lanes_from_histogram(distances, counts)
+
+    def clear_cache(self) -> None:
+        """Drop all memoized statistics."""
+        for method in (
+            GridGameStatsService.get_statistics,
+            GridGameStatsService.get_position_heatmap,
+            GridGameStatsService.get_floor_analysis,
+            GridGameStatsService.get_lane_analysis,
+        ):
+            method.cache_clear()
 
+    @async_ttl_cache(ttl_seconds=30)
     async def get_statistics(
         self,
-        period: str = "24h",
+        period: Period = "24h",
     ) -> GridGameStatistics:
         """Get complete grid game statistics."""
-        hours_map = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
-        hours = hours_map.get(period, 24)
+        hours = _HOURS_MAP.get(period, 24)
 
-        rounds = await self.get_rounds(hours=hours)
+        # Common and game-specific stats, queried concurrently
+        game_specific = {
+            "mines": self._position_heatmap,
+            "towers": self._floor_analysis,
+            "chickenroad": self._lane_analysis,
+        }.get(self.game_type)
 
-        # Common stats
-        tile_analysis = self.calculator.analyze_tiles(rounds)
-        risk_comparison = self.calculator.analyze_risk_levels(rounds)
+        tasks = [self._tile_analysis(hours), self._risk_comparison(hours)]
+        if game_specific is not None:
+            tasks.append(game_specific(hours))
+        tile_analysis, risk_comparison, *specific = await asyncio.gather(*tasks)
 
-        # Game-specific stats
         position_heatmap = None
         floor_analysis = None
         lane_analysis = None
 
         if self.game_type == "mines":
-            position_heatmap = self.calculator.analyze_mine_positions(rounds)
+            position_heatmap = specific[0]
         elif self.game_type == "towers":
-            floor_analysis = self.calculator.analyze_towers_floors(rounds)
+            floor_analysis = specific[0]
         elif self.game_type == "chickenroad":
-            lane_analysis = self.calculator.analyze_chicken_road_lanes(rounds)
+            lane_analysis = specific[0]
 
-        return GridGameStatistics(
+        return GridGameStatistics.model_construct(
             game=self.game,
             game_type=self.game_type,
             period=period,
@@ -485,6 +798,24 @@ class GridGameStatsService:
             lane_analysis=lane_analysis,
         )
 
+    @async_ttl_cache(ttl_seconds=30)
+    async def get_position_heatmap(self, period: Period = "7d") -> PositionHeatmap:
+        """Get mine position heatmap (Mines)."""
+        hours = _HOURS_MAP.get(period, 168)
+        return await self._position_heatmap(hours)
+
+    @async_ttl_cache(ttl_seconds=30)
+    async def get_floor_analysis(self, period: Period = "7d") -> TowersFloorAnalysis:
+        """Get floor analysis (Towers)."""
+        hours = _HOURS_MAP.get(period, 168)
+        return await self._floor_analysis(hours)
+
+    @async_ttl_cache(ttl_seconds=30)
+    async def get_lane_analysis(self, period: Period = "7d") -> ChickenRoadLaneAnalysis:
+        """Get lane analysis (Chicken Road)."""
+        hours = _HOURS_MAP.get(period, 168)
+        return await self._lane_analysis(hours)
+
 
 # =============================================================================
 # Router Factory
@@ -492,7 +823,11 @@ class GridGameStatsService:
 
 def create_grid_game_router(db_pool, game: str, game_type: str) -> APIRouter:
     """Create router for grid game statistics."""
-    router = APIRouter(prefix="/api/v2/grid", tags=["grid-stats"])
+    router = APIRouter(
+        prefix="/api/v2/grid",
+        tags=["grid-stats"],
+        default_response_class=ORJSONResponse,
+    )
     service = GridGameStatsService(db_pool, game, game_type)
 
     @router.get(
@@ -502,7 +837,7 @@ def create_grid_game_router(db_pool, game: str, game_type: str) -> APIRouter:
     )
     async def get_grid_stats(
         game_name: str,
-        period: str = Query("24h", regex="^(1h|6h|24h|7d|30d)$"),
+        period: Period = Query("24h"),
     ):
         if game_name != game:
             raise HTTPException(status_code=404, detail="Game not found")
@@ -516,14 +851,11 @@ def create_grid_game_router(db_pool, game: str, game_type: str) -> APIRouter:
         )
         async def get_mine_heatmap(
             game_name: str,
-            period: str = Query("7d"),
+            period: Period = Query("7d"),
         ):
             if game_name != game:
                 raise HTTPException(status_code=404, detail="Game not found")
-            hours_map = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
-            hours = hours_map.get(period, 168)
-            rounds = await service.get_rounds(hours=hours)
-            return service.calculator.analyze_mine_positions(rounds)
+            return await service.get_position_heatmap(period)
 
     if game_type == "towers":
         @router.get(
@@ -533,14 +865,11 @@ def create_grid_game_router(db_pool, game: str, game_type: str) -> APIRouter:
         )
         async def get_floor_analysis(
             game_name: str,
-            period: str = Query("7d"),
+            period: Period = Query("7d"),
         ):
             if game_name != game:
                 raise HTTPException(status_code=404, detail="Game not found")
-            hours_map = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
-            hours = hours_map.get(period, 168)
-            rounds = await service.get_rounds(hours=hours)
-            return service.calculator.analyze_towers_floors(rounds)
+            return await service.get_floor_analysis(period)
 
     if game_type == "chickenroad":
         @router.get(
@@ -550,14 +879,11 @@ def create_grid_game_router(db_pool, game: str, game_type: str) -> APIRouter:
         )
         async def get_lane_analysis(
             game_name: str,
-            period: str = Query("7d"),
+            period: Period = Query("7d"),
         ):
             if game_name != game:
                 raise HTTPException(status_code=404, detail="Game not found")
-            hours_map = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
-            hours = hours_map.get(period, 168)
-            rounds = await service.get_rounds(hours=hours)
-            return service.calculator.analyze_chicken_road_lanes(rounds)
+            return await service.get_lane_analysis(period)
 
     return router
 
@@ -9,16 +9,21 @@ Author: Crash Games Team
 Version: 1.0.0
 """
 
+import asyncio
+import base64
+import binascii
 import logging
 import os
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 import aiosqlite
+import orjson
 from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
 # Game-specific statistics
@@ -72,9 +77,206 @@ ALLOWED_ORIGINS: List[str] = [
     os.getenv("SECONDARY_DOMAIN", "https://www.minestracker.com"),
 ]
 
+# Skip CORSMiddleware when a reverse proxy (Nginx/Caddy) emits CORS headers
+CORS_HANDLED_BY_PROXY: bool = os.getenv("CORS_HANDLED_BY_PROXY", "").lower() in (
+    "1", "true", "yes"
+)
+
 # Constants for mine count distribution
 MINE_COUNT_RANGE: List[int] = list(range(1, 25))  # 1-24 mines possible
 
+# Number of pooled read-only connections
+DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", str(os.cpu_count() or 4)))
+
+# Seconds /api/stats/recent results are reused per limit value
+RECENT_STATS_TTL_SECONDS: float = 1.0
+
+# Interval at which the cached ISO timestamp is refreshed
+CLOCK_REFRESH_SECONDS: float = 0.2
+
+# Seconds serialized summary/distribution responses are served from cache
+RESPONSE_CACHE_TTL_SECONDS: float = 2.0
+
+# Rows pulled from the aiosqlite worker thread per round-trip in /api/rounds
+ROUNDS_FETCH_BATCH: int = 100
+
+# Prepared statements cached per connection by the sqlite3 module
+STATEMENT_CACHE_SIZE: int = 256
+
+# SQLite settings applied to every connection (not persisted by SQLite)
+CONNECTION_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# SQLite settings applied once at startup (WAL mode is stored in the file)
+STARTUP_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+)
+
+
+# =============================================================================
+# SQL Statements
+# =============================================================================
+# Hot read queries are module-level constants so every request passes the
+# identical SQL text, letting the per-connection sqlite3 statement cache
+# reuse the prepared statement instead of re-parsing and re-planning it.
+# Small results are read with execute_fetchall(), which executes and fetches
+# in a single hop to the aiosqlite worker thread instead of two.
+
+# Exact round count kept by the roll-up trigger (see _SQL_AGGREGATE_SCHEMA)
+_SQL_COUNT_ROUNDS = "SELECT total FROM mines_stats WHERE id = 1"
+
+# Both page queries are answered entirely from the covering idx_rounds_page
+_SQL_ROUNDS_PAGE = """
+    SELECT id, round_id, mines_count, gems_revealed, cashout_multiplier, won, created_at
+    FROM mines_rounds INDEXED BY idx_rounds_page
+    ORDER BY created_at DESC, id DESC
+    LIMIT ? OFFSET ?
+"""
+
+# Keyset page: seeks past the cursor row instead of skipping
+_SQL_ROUNDS_AFTER = """
+    SELECT id, round_id, mines_count, gems_revealed, cashout_multiplier, won, created_at
+    FROM mines_rounds INDEXED BY idx_rounds_page
+    WHERE (created_at, id) < (?, ?)
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+"""
+
+# Summary read from the trigger-maintained roll-ups (see _SQL_AGGREGATE_SCHEMA)
+_SQL_SUMMARY = """
+    SELECT
+        total,
+        sum_gems * 1.0 / NULLIF(total, 0) as avg_gems,
+        wins * 100.0 / NULLIF(total, 0) as win_rate,
+        sum_cashout_win / NULLIF(count_cashout_win, 0) as avg_cashout,
+        (
+            SELECT mines_count
+            FROM mines_by_count
+            ORDER BY cnt DESC, mines_count
+            LIMIT 1
+        ) as popular_mines
+    FROM mines_stats
+    WHERE id = 1
+"""
+
+# Newest rows by rowid: a backwards primary-key scan with no temp sort
+_SQL_RECENT = """
+    SELECT
+        AVG(gems_revealed) as avg_gems,
+        SUM(CASE WHEN won THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as win_rate
+    FROM (
+        SELECT gems_revealed, won
+        FROM mines_rounds
+        ORDER BY id DESC
+        LIMIT ?
+    )
+"""
+
+# Distribution read from the mines_by_count roll-up, total folded in
+_SQL_DISTRIBUTION = """
+    SELECT mines_count, cnt as count, SUM(cnt) OVER () as total
+    FROM mines_by_count
+    WHERE cnt > 0
+    ORDER BY mines_count
+"""
+
+# Newest row by primary key; stops after one row instead of scanning for MAX
+_SQL_LAST_UPDATE = "SELECT created_at FROM mines_rounds ORDER BY id DESC LIMIT 1"
+
+
+# Main table and indexes. round_id needs no separate index: its UNIQUE
+# constraint already creates one, so the old duplicate is dropped. The
+# covering idx_rounds_page replaces idx_created_id for /api/rounds, and
+# idx_created, a strict prefix of it, would only be a second created_at
+# index to maintain on every insert. idx_mines_count and idx_won are
+# dropped: summary and distribution read the roll-ups, so they only slowed
+# every insert.
+_SQL_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS mines_rounds (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        round_id TEXT UNIQUE NOT NULL,
+        mines_count INTEGER NOT NULL,
+        gems_revealed INTEGER NOT NULL,
+        cashout_multiplier REAL NOT NULL,
+        won BOOLEAN NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_rounds_page ON mines_rounds(
+        created_at DESC, id DESC,
+        round_id, mines_count, gems_revealed, cashout_multiplier, won
+    );
+    DROP INDEX IF EXISTS idx_round_id;
+    DROP INDEX IF EXISTS idx_created_id;
+    DROP INDEX IF EXISTS idx_created;
+    DROP INDEX IF EXISTS idx_mines_count;
+    DROP INDEX IF EXISTS idx_won;
+"""
+
+# Running aggregates maintained by an AFTER INSERT trigger so the summary and
+# distribution endpoints read a handful of rows instead of scanning
+# mines_rounds. Existing rows are backfilled only while mines_stats is still
+# empty: the one-row "fresh" guard is the outer side of a CROSS JOIN, so once
+# the roll-ups exist it is empty and mines_rounds is never scanned again.
+# mines_stats is filled last so a fresh database backfills both roll-ups.
+_SQL_AGGREGATE_SCHEMA = """
+    BEGIN IMMEDIATE;
+
+    CREATE TABLE IF NOT EXISTS mines_stats (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        total INTEGER NOT NULL,
+        sum_gems INTEGER NOT NULL,
+        wins INTEGER NOT NULL,
+        sum_cashout_win REAL NOT NULL,
+        count_cashout_win INTEGER NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS mines_by_count (
+        mines_count INTEGER PRIMARY KEY,
+        cnt INTEGER NOT NULL
+    );
+
+    INSERT OR IGNORE INTO mines_by_count (mines_count, cnt)
+    SELECT r.mines_count, COUNT(*)
+    FROM (SELECT 1 WHERE NOT EXISTS (SELECT 1 FROM mines_stats)) AS fresh
+    CROSS JOIN mines_rounds AS r
+    GROUP BY r.mines_count;
+
+    INSERT OR IGNORE INTO mines_stats
+    SELECT
+        1,
+        COUNT(*),
+        COALESCE(SUM(r.gems_revealed), 0),
+        COALESCE(SUM(CASE WHEN r.won THEN 1 ELSE 0 END), 0),
+        COALESCE(SUM(CASE WHEN r.won THEN r.cashout_multiplier ELSE 0 END), 0),
+        COALESCE(SUM(CASE WHEN r.won THEN 1 ELSE 0 END), 0)
+    FROM (SELECT 1 WHERE NOT EXISTS (SELECT 1 FROM mines_stats)) AS fresh
+    CROSS JOIN mines_rounds AS r;
+
+    CREATE TRIGGER IF NOT EXISTS mines_rounds_agg
+    AFTER INSERT ON mines_rounds
+    BEGIN
+        UPDATE mines_stats SET
+            total = total + 1,
+            sum_gems = sum_gems + NEW.gems_revealed,
+            wins = wins + CASE WHEN NEW.won THEN 1 ELSE 0 END,
+            sum_cashout_win = sum_cashout_win
+                + CASE WHEN NEW.won THEN NEW.cashout_multiplier ELSE 0 END,
+            count_cashout_win = count_cashout_win + CASE WHEN NEW.won THEN 1 ELSE 0 END
+        WHERE id = 1;
+
+        INSERT INTO mines_by_count (mines_count, cnt)
+        VALUES (NEW.mines_count, 1)
+        ON CONFLICT (mines_count) DO UPDATE SET cnt = cnt + 1;
+    END;
+
+    COMMIT;
+"""
 
 # =============================================================================
 # Pydantic Models
@@ -106,10 +308,12 @@ class RoundsResponse(BaseModel):
 
     Attributes:
         items: List of Round objects.
-        total: Total number of rounds in the database.
+        total: Total number of rounds in the database (only if requested).
+        next_cursor: Opaque cursor for the next page, None on the last page.
     """
     items: List[Round] = Field(..., description="List of game rounds")
-    total: int = Field(..., ge=0, description="Total number of rounds")
+    total: Optional[int] = Field(None, ge=0, description="Total number of rounds")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page")
 
 
 class SummaryStats(BaseModel):
@@ -138,7 +342,9 @@ class RecentStats(BaseModel):
         avg_gems_revealed: Average gems revealed in recent rounds.
         win_rate: Win rate percentage for recent rounds.
     """
-    avg_gems_revealed: float = Field(..., ge=0, description="Average gems revealed for recent rounds")
+    avg_gems_revealed: float = Field(
+        ..., ge=0, description="Average gems revealed for recent rounds"
+    )
     win_rate: float = Field(..., ge=0, le=100, description="Win rate percentage")
 
 
@@ -204,6 +410,53 @@ class ErrorResponse(BaseModel):
     request_id: Optional[str] = Field(None, description="Request tracking ID")
 
 
+# =============================================================================
+# Payout Tables
+# =============================================================================
+
+def compute_payout_table(mines: int) -> List[PayoutInfo]:
+    """
+    Calculate theoretical payout multipliers for a given mine count.
+
+    Args:
+        mines: Number of mines in the game (1-24).
+
+    Returns:
+        List[PayoutInfo]: Payout information for each gems count.
+    """
+    gems_count = 25 - mines
+    rtp = 0.97
+    payouts: List[PayoutInfo] = []
+
+    # Probability of revealing `gems` gems is a running product, so each
+    # step extends the previous one instead of recomputing from scratch
+    prob = 1.0
+    for gems in range(1, gems_count + 1):
+        prob *= (gems_count - (gems - 1)) / (25 - (gems - 1))
+
+        # Calculate multiplier with house edge
+        multiplier = round(rtp / prob, 2)
+
+        payouts.append(PayoutInfo(
+            gems=gems,
+            multiplier=multiplier,
+            probability=round(prob * 100, 2)
+        ))
+
+    return payouts
+
+
+# Payout tables depend only on the mine count, so all 24 are computed and
+# serialized once at import instead of on every request
+_PAYOUT_TABLES: Dict[int, List[PayoutInfo]] = {
+    mines: compute_payout_table(mines) for mines in MINE_COUNT_RANGE
+}
+_PAYOUT_JSON: Dict[int, bytes] = {
+    mines: orjson.dumps([p.model_dump() for p in table])
+    for mines, table in _PAYOUT_TABLES.items()
+}
+
+
 # =============================================================================
 # Database Connection Management
 # =============================================================================
@@ -224,6 +477,8 @@ class DatabaseManager:
             db_path: Path to the SQLite database file.
         """
         self.db_path = db_path
+        self._connection_pragmas = "; ".join(CONNECTION_PRAGMAS) + ";"
+        self._health_conn: Optional[aiosqlite.Connection] = None
 
     @asynccontextmanager
     async def connect(self) -> AsyncGenerator[aiosqlite.Connection, None]:
@@ -240,6 +495,7 @@ class DatabaseManager:
         try:
             db = await aiosqlite.connect(self.db_path)
             db.row_factory = aiosqlite.Row
+            await db.executescript(self._connection_pragmas)
             logger.debug(f"Database connection established to {self.db_path}")
             yield db
         except aiosqlite.Error as e:
@@ -253,27 +509,312 @@ class DatabaseManager:
                 await db.close()
                 logger.debug("Database connection closed")
 
+    async def open_health_connection(self) -> None:
+        """
+        Open the long-lived read-only connection used by health probes.
+
+        Keeping probes on their own connection means liveness checks never
+        wait on, or take a connection from, the request pool.
+
+        Raises:
+            aiosqlite.Error: If the connection cannot be established.
+        """
+        self._health_conn = await aiosqlite.connect(
+            f"file:{self.db_path}?mode=ro", uri=True
+        )
+        await self._health_conn.executescript(self._connection_pragmas)
+
+    async def close_health_connection(self) -> None:
+        """Close the health probe connection if it is open."""
+        if self._health_conn:
+            await self._health_conn.close()
+            self._health_conn = None
+
+    async def fetch_last_update(self) -> Optional[str]:
+        """
+        Get the timestamp of the most recently inserted round.
+
+        Returns:
+            Optional[str]: created_at of the newest round, None if empty.
+
+        Raises:
+            aiosqlite.Error: If the probe connection is closed or the query fails.
+        """
+        if self._health_conn is None:
+            raise aiosqlite.OperationalError("Health connection is not open")
+
+        rows = await self._health_conn.execute_fetchall(_SQL_LAST_UPDATE)
+        return rows[0][0] if rows else None
+
+
+class ConnectionPool:
+    """
+    Pool of long-lived aiosqlite connections shared across requests.
+
+    Holds a queue of read-only connections; the API never writes through
+    the pool (the collector owns all inserts). Reusing connections keeps
+    each connection's page cache warm and avoids spawning a new aiosqlite
+    worker thread per request.
+    """
+
+    def __init__(self, db_path: str, size: int) -> None:
+        """
+        Initialize an empty pool; call open() before acquiring.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            size: Number of read-only connections to keep open.
+        """
+        self.db_path = db_path
+        self.size = max(1, size)
+        self._readers: "asyncio.Queue[aiosqlite.Connection]" = asyncio.Queue()
+        self._connections: List[aiosqlite.Connection] = []
+        self._connection_pragmas = "; ".join(CONNECTION_PRAGMAS) + ";"
+
+    async def _open_connection(self) -> aiosqlite.Connection:
+        """
+        Open a single read-only connection.
 
-# Create singleton database manager
+        Returns:
+            aiosqlite.Connection: Connection with Row factory and PRAGMAs set.
+        """
+        db = await aiosqlite.connect(
+            f"file:{self.db_path}?mode=ro",
+            uri=True,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        db.row_factory = aiosqlite.Row
+        await db.executescript(self._connection_pragmas)
+        self._connections.append(db)
+        return db
+
+    async def open(self) -> None:
+        """
+        Open all reader connections.
+
+        Raises:
+            aiosqlite.Error: If a connection cannot be established.
+        """
+        for _ in range(self.size):
+            self._readers.put_nowait(await self._open_connection())
+        logger.info(f"Connection pool opened: {self.size} readers")
+
+    async def close(self) -> None:
+        """Close every connection owned by the pool."""
+        while not self._readers.empty():
+            self._readers.get_nowait()
+        for db in self._connections:
+            await db.close()
+        self._connections.clear()
+        logger.info("Connection pool closed")
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """
+        Borrow a reader from the pool and return it on exit.
+
+        The reader is handed to release() in a finally block, so an exception
+        in the caller can never leak a connection out of the pool.
+
+        Yields:
+            aiosqlite.Connection: Pooled database connection.
+
+        Raises:
+            HTTPException: If the pool has not been opened.
+        """
+        if not self._connections:
+            raise HTTPException(
+                status_code=503,
+                detail="Database connection failed"
+            )
+
+        db = await self._readers.get()
+        try:
+            yield db
+        finally:
+            await self.release(db)
+
+    async def release(self, db: aiosqlite.Connection) -> None:
+        """
+        Return a reader to the pool.
+
+        Borrowers close their cursors before the connection comes back (see
+        get_rounds), since a statement left stepping would hold its read
+        snapshot open for the next borrower and block WAL checkpoints.
+
+        Args:
+            db: Reader connection previously taken from the pool.
+        """
+        self._readers.put_nowait(db)
+
+
+# Create singleton database manager and connection pool
 db_manager = DatabaseManager(DATABASE_PATH)
+db_pool = ConnectionPool(DATABASE_PATH, DB_POOL_SIZE)
 
 
 async def get_db() -> AsyncGenerator[aiosqlite.Connection, None]:
     """
     Dependency function for database connection injection.
 
+    The connection is released in the dependency's exit code, which FastAPI
+    (>= 0.106) runs before the response is sent, so it is back in the pool
+    by the time the client sees the response, on success or error.
+
     Yields:
-        aiosqlite.Connection: Database connection.
+        aiosqlite.Connection: Pooled read-only database connection.
 
     Example:
         @app.get("/api/data")
         async def get_data(db: aiosqlite.Connection = Depends(get_db)):
             cursor = await db.execute("SELECT * FROM table")
     """
-    async with db_manager.connect() as db:
+    async with db_pool.acquire() as db:
         yield db
 
 
+# =============================================================================
+# Cached Results
+# =============================================================================
+
+# Recent stats per limit: (monotonic time computed, result)
+_recent_cache: Dict[int, Tuple[float, "RecentStats"]] = {}
+
+
+class TTLCache:
+    """
+    Tiny in-process cache of serialized response bodies.
+
+    Entries expire ttl_seconds after they are stored; expired entries are
+    replaced on the next store for the same key.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl_seconds: Lifetime of each entry in seconds.
+        """
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[float, bytes]] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached body if it has not expired.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Optional[bytes]: Cached body, or None on miss or expiry.
+        """
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def set(self, key: str, body: bytes) -> None:
+        """
+        Store a body under key for ttl_seconds.
+
+        Args:
+            key: Cache key.
+            body: Serialized response body.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, body)
+
+
+# Serialized bodies for read-mostly aggregate endpoints
+_response_cache = TTLCache(RESPONSE_CACHE_TTL_SECONDS)
+
+# Current UTC time in ISO format, refreshed every CLOCK_REFRESH_SECONDS
+_now_iso: str = datetime.utcnow().isoformat()
+_clock_task: Optional[asyncio.Task] = None
+
+
+async def refresh_clock() -> None:
+    """
+    Keep _now_iso current so response timestamps skip per-call formatting.
+
+    Runs until cancelled at shutdown.
+    """
+    global _now_iso
+    while True:
+        _now_iso = datetime.utcnow().isoformat()
+        await asyncio.sleep(CLOCK_REFRESH_SECONDS)
+
+
+async def count_rounds(db: aiosqlite.Connection) -> int:
+    """
+    Return the total number of rounds.
+
+    Reads the trigger-maintained mines_stats row, an O(1) lookup that is
+    always exact, instead of running COUNT(*) over the table.
+
+    Args:
+        db: Database connection.
+
+    Returns:
+        int: Total number of rounds.
+    """
+    rows = await db.execute_fetchall(_SQL_COUNT_ROUNDS)
+    return rows[0][0] if rows else 0
+
+
+# =============================================================================
+# Pagination Helpers
+# =============================================================================
+
+def iso_timestamp(value: Optional[str]) -> Optional[str]:
+    """
+    Normalize an SQLite timestamp to the ISO 8601 form Pydantic emits.
+
+    Args:
+        value: Timestamp as stored, e.g. '2026-01-17 10:30:00'.
+
+    Returns:
+        Optional[str]: Timestamp with a 'T' separator, e.g. '2026-01-17T10:30:00'.
+    """
+    return value.replace(" ", "T", 1) if value else value
+
+
+def encode_cursor(created_at: str, row_id: int) -> str:
+    """
+    Encode a keyset position as an opaque URL-safe cursor.
+
+    Args:
+        created_at: Timestamp of the last row on the page.
+        row_id: Primary key of the last row on the page.
+
+    Returns:
+        str: Base64-encoded cursor.
+    """
+    raw = f"{created_at}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Opaque cursor from a previous response.
+
+    Returns:
+        Tuple[str, int]: The (created_at, id) keyset position.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, row_id = raw.rsplit("|", 1)
+        return created_at, int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
 # =============================================================================
 # FastAPI Application Setup
 # =============================================================================
@@ -283,7 +824,8 @@ app = FastAPI(
     description="Real-time statistics API for Spribe Mines game",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -291,15 +833,17 @@ app = FastAPI(
 # CORS Configuration (Security Fix)
 # =============================================================================
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=ALLOWED_ORIGINS,
-    allow_credentials=False,  # API doesn't require credentials
-    allow_methods=["GET", "HEAD", "OPTIONS"],  # Read-only API
-    allow_headers=["Content-Type", "Accept"],
-    expose_headers=["Content-Length", "Content-Range"],
-    max_age=3600,
-)
+# Accept is CORS-safelisted and no endpoint sends Content-Range
+if not CORS_HANDLED_BY_PROXY:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=ALLOWED_ORIGINS,
+        allow_credentials=False,  # API doesn't require credentials
+        allow_methods=["GET", "HEAD", "OPTIONS"],  # Read-only API
+        allow_headers=["Content-Type"],
+        expose_headers=["Content-Length"],
+        max_age=3600,
+    )
 
 
 # =============================================================================
@@ -322,7 +866,7 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
     error_response = ErrorResponse(
         error="internal_error",
         detail="An internal server error occurred",
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=_now_iso,
         request_id=request.headers.get("X-Request-ID")
     )
     return JSONResponse(
@@ -347,7 +891,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     error_response = ErrorResponse(
         error="http_error",
         detail=str(exc.detail),
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=_now_iso,
         request_id=request.headers.get("X-Request-ID")
     )
     return JSONResponse(
@@ -372,7 +916,7 @@ async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse
     error_response = ErrorResponse(
         error="validation_error",
         detail=str(exc),
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=_now_iso,
         request_id=request.headers.get("X-Request-ID")
     )
     return JSONResponse(
@@ -382,7 +926,7 @@ async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse
 
 
 # =============================================================================
-# Startup Event
+# Startup / Shutdown Events
 # =============================================================================
 
 @app.on_event("startup")
@@ -390,47 +934,45 @@ async def startup() -> None:
     """
     Application startup event handler.
 
-    Creates the database table and indexes if they don't exist.
+    Creates the database table, indexes and roll-ups if they don't exist,
+    then opens the connection pool and the health probe connection.
     Logs the startup process for monitoring.
     """
+    global _clock_task
     logger.info("Starting Mines Tracker API...")
+    _clock_task = asyncio.create_task(refresh_clock())
 
     try:
         async with db_manager.connect() as db:
-            # Create main table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS mines_rounds (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    round_id TEXT UNIQUE NOT NULL,
-                    mines_count INTEGER NOT NULL,
-                    gems_revealed INTEGER NOT NULL,
-                    cashout_multiplier REAL NOT NULL,
-                    won BOOLEAN NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Create indexes for performance
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_mines_count ON mines_rounds(mines_count)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_created ON mines_rounds(created_at DESC)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_round_id ON mines_rounds(round_id)"
+            # Pragmas, table, indexes and roll-ups in one worker round-trip
+            await db.executescript(
+                "; ".join(STARTUP_PRAGMAS) + ";"
+                + _SQL_SCHEMA
+                + _SQL_AGGREGATE_SCHEMA
             )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_won ON mines_rounds(won)"
-            )
-
-            await db.commit()
             logger.info("Database initialized successfully")
+
+        await db_pool.open()
+        await db_manager.open_health_connection()
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}", exc_info=True)
         raise
 
 
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    """
+    Application shutdown event handler.
+
+    Stops the clock task and closes the health probe connection and all
+    pooled connections.
+    """
+    if _clock_task:
+        _clock_task.cancel()
+    await db_manager.close_health_connection()
+    await db_pool.close()
+
+
 # =============================================================================
 # API Endpoints
 # =============================================================================
@@ -446,65 +988,93 @@ async def get_rounds(
     offset: int = Query(
         default=0,
         ge=0,
-        description="Number of rounds to skip (must be >= 0)"
+        description="Number of rounds to skip (must be >= 0); ignored with cursor"
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Opaque cursor from a previous page's next_cursor"
+    ),
+    include_total: bool = Query(
+        default=False,
+        description="Include the total round count (requires a full count)"
     ),
     db: aiosqlite.Connection = Depends(get_db)
-) -> RoundsResponse:
+) -> ORJSONResponse:
     """
     Get paginated list of game rounds.
 
     Retrieves game rounds ordered by creation time (most recent first).
-    Supports pagination through limit and offset parameters.
+    Supports keyset pagination through the cursor parameter, and legacy
+    offset pagination when no cursor is given.
 
     Args:
         limit: Maximum number of rounds to return (default: 50, max: 500).
         offset: Number of rounds to skip for pagination (default: 0).
+        cursor: Keyset cursor returned as next_cursor by the previous page.
+        include_total: Whether to count all rounds (default: False).
         db: Database connection (injected).
 
     Returns:
-        RoundsResponse: Paginated list of rounds with total count.
+        ORJSONResponse: RoundsResponse-shaped page with next cursor and
+        optional total.
 
     Raises:
-        HTTPException: If database query fails.
+        HTTPException: If the cursor is invalid or the database query fails.
 
     Example:
-        GET /api/rounds?limit=100&offset=0
-        Response: {"items": [...], "total": 5000}
+        GET /api/rounds?limit=100&include_total=true
+        Response: {"items": [...], "total": 5000, "next_cursor": "MjAy..."}
+        GET /api/rounds?limit=100&cursor=MjAy...
     """
-    logger.debug(f"Fetching rounds with limit={limit}, offset={offset}")
+    logger.debug(
+        f"Fetching rounds with limit={limit}, offset={offset}, cursor={cursor}"
+    )
 
     try:
-        # Get total count
-        cursor = await db.execute("SELECT COUNT(*) FROM mines_rounds")
-        total = (await cursor.fetchone())[0]
+        total = await count_rounds(db) if include_total else None
 
         # Get paginated rounds
-        cursor = await db.execute(
-            """
-            SELECT round_id, mines_count, gems_revealed, cashout_multiplier, won, created_at
-            FROM mines_rounds
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-            """,
-            (limit, offset)
-        )
-        rows = await cursor.fetchall()
-
-        items = [
-            Round(
-                round_id=row["round_id"],
-                mines_count=row["mines_count"],
-                gems_revealed=row["gems_revealed"],
-                cashout_multiplier=row["cashout_multiplier"],
-                won=bool(row["won"]),
-                created_at=row["created_at"]
-            )
-            for row in rows
-        ]
+        if cursor:
+            created_at, row_id = decode_cursor(cursor)
+            page_sql, page_params = _SQL_ROUNDS_AFTER, (created_at, row_id, limit)
+        else:
+            page_sql, page_params = _SQL_ROUNDS_PAGE, (limit, offset)
+
+        # Stream rows straight into plain dicts from positional columns; no
+        # full row list, no model validation. async for pulls iter_chunk_size
+        # rows per worker-thread hop (aiosqlite defaults to 64). The cursor
+        # is closed on exit even if iteration fails, so no statement is left
+        # running when the connection returns to the pool.
+        items: List[Dict[str, Any]] = []
+        last: Optional[aiosqlite.Row] = None
+        async with db.execute(page_sql, page_params) as rows_cursor:
+            rows_cursor.iter_chunk_size = ROUNDS_FETCH_BATCH
+            async for row in rows_cursor:
+                items.append({
+                    "round_id": row[1],
+                    "mines_count": row[2],
+                    "gems_revealed": row[3],
+                    "cashout_multiplier": row[4],
+                    "won": bool(row[5]),
+                    "created_at": iso_timestamp(row[6]),
+                })
+                last = row
+
+        next_cursor: Optional[str] = None
+        if last is not None and len(items) == limit:
+            next_cursor = encode_cursor(last[6], last[0])
 
         logger.info(f"Retrieved {len(items)} rounds (total: {total})")
-        return RoundsResponse(items=items, total=total)
+        return ORJSONResponse(
+            {"items": items, "total": total, "next_cursor": next_cursor}
+        )
 
+    except ValueError as e:
+        logger.warning(f"Invalid rounds request: {e}")
+        raise HTTPException(
+            status_code=422,
+            detail=str(e)
+        ) from e
     except aiosqlite.Error as e:
         logger.error(f"Database error fetching rounds: {e}", exc_info=True)
         raise HTTPException(
@@ -514,18 +1084,17 @@ async def get_rounds(
 
 
 @app.get("/api/stats/summary", response_model=SummaryStats)
-async def get_summary(db: aiosqlite.Connection = Depends(get_db)) -> SummaryStats:
+async def get_summary() -> Response:
     """
     Get summary statistics for all game rounds.
 
     Calculates aggregate statistics including win rate, average gems revealed,
-    most popular mine count, and average cashout multiplier.
-
-    Args:
-        db: Database connection (injected).
+    most popular mine count, and average cashout multiplier. The serialized
+    body is cached for RESPONSE_CACHE_TTL_SECONDS, and cache hits do not
+    borrow a database connection.
 
     Returns:
-        SummaryStats: Aggregate statistics for all rounds.
+        Response: SummaryStats-shaped JSON aggregate statistics.
 
     Raises:
         HTTPException: If database query fails.
@@ -536,39 +1105,30 @@ async def get_summary(db: aiosqlite.Connection = Depends(get_db)) -> SummaryStat
     """
     logger.debug("Fetching summary statistics")
 
+    cached = _response_cache.get("summary")
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     try:
-        # Get main statistics in a single query
-        cursor = await db.execute("""
-            SELECT
-                COUNT(*) as total,
-                AVG(gems_revealed) as avg_gems,
-                SUM(CASE WHEN won THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as win_rate,
-                AVG(CASE WHEN won THEN cashout_multiplier ELSE NULL END) as avg_cashout
-            FROM mines_rounds
-        """)
-        row = await cursor.fetchone()
-
-        # Get most popular mine count
-        cursor = await db.execute("""
-            SELECT mines_count, COUNT(*) as cnt
-            FROM mines_rounds
-            GROUP BY mines_count
-            ORDER BY cnt DESC
-            LIMIT 1
-        """)
-        popular_row = await cursor.fetchone()
-        most_popular_mines = popular_row[0] if popular_row else 3
-
-        result = SummaryStats(
-            total_rounds=row[0] or 0,
-            avg_gems_revealed=round(row[1] or 0, 4),
-            win_rate=round(row[2] or 0, 2),
-            most_popular_mines=most_popular_mines,
-            avg_cashout_multiplier=round(row[3] or 0, 4)
-        )
+        # Read the pre-aggregated statistics row
+        async with db_pool.acquire() as db:
+            rows = await db.execute_fetchall(_SQL_SUMMARY)
+        row = rows[0] if rows else (0, None, None, None, None)
+        most_popular_mines = row[4] if row[4] is not None else 3
+
+        result = {
+            "total_rounds": row[0] or 0,
+            "win_rate": round(row[2] or 0.0, 2),
+            "avg_gems_revealed": round(row[1] or 0.0, 4),
+            "most_popular_mines": most_popular_mines,
+            "avg_cashout_multiplier": round(row[3] or 0.0, 4),
+        }
 
-        logger.info(f"Summary stats: {result.total_rounds} total rounds")
-        return result
+        body = orjson.dumps(result)
+        _response_cache.set("summary", body)
+
+        logger.info(f"Summary stats: {result['total_rounds']} total rounds")
+        return Response(content=body, media_type="application/json")
 
     except aiosqlite.Error as e:
         logger.error(f"Database error fetching summary: {e}", exc_info=True)
@@ -585,17 +1145,17 @@ async def get_recent_stats(
         ge=1,
         le=1000,
         description="Number of recent rounds to analyze (1-1000)"
-    ),
-    db: aiosqlite.Connection = Depends(get_db)
+    )
 ) -> RecentStats:
     """
     Get statistics for recent game rounds.
 
-    Analyzes the most recent N rounds to provide current trend data.
+    Analyzes the most recent N rounds to provide current trend data. Results
+    are reused for RECENT_STATS_TTL_SECONDS per limit, and cache hits do not
+    borrow a database connection.
 
     Args:
         limit: Number of recent rounds to analyze (default: 100, max: 1000).
-        db: Database connection (injected).
 
     Returns:
         RecentStats: Statistics for recent rounds.
@@ -609,25 +1169,22 @@ async def get_recent_stats(
     """
     logger.debug(f"Fetching recent stats for last {limit} rounds")
 
+    now = time.monotonic()
+    cached = _recent_cache.get(limit)
+    if cached and now - cached[0] < RECENT_STATS_TTL_SECONDS:
+        return cached[1]
+
     try:
-        cursor = await db.execute("""
-            SELECT
-                AVG(gems_revealed) as avg_gems,
-                SUM(CASE WHEN won THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as win_rate
-            FROM (
-                SELECT gems_revealed, won
-                FROM mines_rounds
-                ORDER BY created_at DESC
-                LIMIT ?
-            )
-        """, (limit,))
-        row = await cursor.fetchone()
+        async with db_pool.acquire() as db:
+            row = (await db.execute_fetchall(_SQL_RECENT, (limit,)))[0]
 
-        result = RecentStats(
-            avg_gems_revealed=round(row[0] or 0, 4),
-            win_rate=round(row[1] or 0, 2)
+        # Trusted DB values: skip constructor validation
+        result = RecentStats.model_construct(
+            avg_gems_revealed=round(row[0] or 0.0, 4),
+            win_rate=round(row[1] or 0.0, 2)
         )
 
+        _recent_cache[limit] = (now, result)
         logger.info(f"Recent stats (last {limit}): avg_gems={result.avg_gems_revealed}")
         return result
 
@@ -640,20 +1197,17 @@ async def get_recent_stats(
 
 
 @app.get("/api/distribution", response_model=List[DistributionBucket])
-async def get_distribution(
-    db: aiosqlite.Connection = Depends(get_db)
-) -> List[DistributionBucket]:
+async def get_distribution() -> Response:
     """
     Get mine count distribution across all rounds.
 
     Returns the count and percentage of rounds for each mine count
-    for visualization and analysis.
-
-    Args:
-        db: Database connection (injected).
+    for visualization and analysis. The serialized body is cached for
+    RESPONSE_CACHE_TTL_SECONDS, and cache hits do not borrow a database
+    connection.
 
     Returns:
-        List[DistributionBucket]: Distribution data for each mine count.
+        Response: DistributionBucket-shaped JSON data for each mine count.
 
     Raises:
         HTTPException: If database query fails.
@@ -668,34 +1222,30 @@ async def get_distribution(
     """
     logger.debug("Fetching mine count distribution")
 
+    cached = _response_cache.get("distribution")
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     try:
-        # Get total count first
-        cursor = await db.execute("SELECT COUNT(*) FROM mines_rounds")
-        total = (await cursor.fetchone())[0] or 1  # Avoid division by zero
-
-        # Get distribution for each mine count
-        cursor = await db.execute("""
-            SELECT mines_count, COUNT(*) as count
-            FROM mines_rounds
-            GROUP BY mines_count
-            ORDER BY mines_count
-        """)
-        rows = await cursor.fetchall()
-
-        result: List[DistributionBucket] = []
-        for row in rows:
-            mines = row[0]
-            count = row[1]
-            percentage = round((count / total) * 100, 2)
-
-            result.append(DistributionBucket(
-                mines=mines,
-                count=count,
-                percentage=percentage
-            ))
+        # Get distribution for each mine count, with the total on every row
+        async with db_pool.acquire() as db:
+            rows = await db.execute_fetchall(_SQL_DISTRIBUTION)
+        total = rows[0][2] if rows else 0
+
+        result = [
+            {
+                "mines": row[0],
+                "count": row[1],
+                "percentage": round((row[1] / total) * 100, 2),
+            }
+            for row in rows
+        ]
+
+        body = orjson.dumps(result)
+        _response_cache.set("distribution", body)
 
         logger.info(f"Distribution calculated for {total} rounds")
-        return result
+        return Response(content=body, media_type="application/json")
 
     except aiosqlite.Error as e:
         logger.error(f"Database error fetching distribution: {e}", exc_info=True)
@@ -713,18 +1263,19 @@ async def get_payout_table(
         le=24,
         description="Number of mines (1-24)"
     )
-) -> List[PayoutInfo]:
+) -> Response:
     """
     Calculate payout multipliers for given mine count.
 
-    Calculates theoretical payout multipliers for each possible number
-    of gems revealed, based on probability and house edge (RTP 97%).
+    Returns theoretical payout multipliers for each possible number of gems
+    revealed, based on probability and house edge (RTP 97%). Tables are
+    precomputed and pre-serialized at import.
 
     Args:
         mines: Number of mines in the game (default: 3, range: 1-24).
 
     Returns:
-        List[PayoutInfo]: Payout information for each gems count.
+        Response: JSON list of PayoutInfo for each gems count.
 
     Raises:
         HTTPException: If mines count is invalid.
@@ -737,33 +1288,13 @@ async def get_payout_table(
             ...
         ]
     """
-    logger.debug(f"Calculating payout table for {mines} mines")
+    logger.debug(f"Serving precomputed payout table for {mines} mines")
 
     try:
         if mines < 1 or mines > 24:
             raise ValueError("Mines count must be between 1 and 24")
 
-        gems_count = 25 - mines
-        rtp = 0.97
-        payouts: List[PayoutInfo] = []
-
-        for gems in range(1, gems_count + 1):
-            # Calculate probability of revealing this many gems
-            prob = 1.0
-            for i in range(gems):
-                prob *= (gems_count - i) / (25 - i)
-
-            # Calculate multiplier with house edge
-            multiplier = round(rtp / prob, 2)
-
-            payouts.append(PayoutInfo(
-                gems=gems,
-                multiplier=multiplier,
-                probability=round(prob * 100, 2)
-            ))
-
-        logger.info(f"Payout table calculated for {mines} mines: {len(payouts)} entries")
-        return payouts
+        return Response(content=_PAYOUT_JSON[mines], media_type="application/json")
 
     except ValueError as e:
         logger.warning(f"Invalid payout table request: {e}")
@@ -797,33 +1328,28 @@ async def health() -> HealthResponse:
     logger.debug("Health check requested")
 
     try:
-        async with db_manager.connect() as db:
-            # Check database connectivity and get last update time
-            cursor = await db.execute(
-                "SELECT MAX(created_at) FROM mines_rounds"
-            )
-            last_update_row = await cursor.fetchone()
-            last_update = last_update_row[0] if last_update_row and last_update_row[0] else None
-
-            response = HealthResponse(
-                status="healthy",
-                game="mines",
-                database="connected",
-                last_data_update=str(last_update) if last_update else "No data",
-                timestamp=datetime.utcnow().isoformat()
-            )
+        # Check database connectivity and get last update time
+        last_update = await db_manager.fetch_last_update()
+
+        response = HealthResponse.model_construct(
+            status="healthy",
+            game="mines",
+            database="connected",
+            last_data_update=str(last_update) if last_update else "No data",
+            timestamp=_now_iso
+        )
 
-            logger.info("Health check: healthy")
-            return response
+        logger.info("Health check: healthy")
+        return response
 
     except Exception as e:
         logger.error(f"Health check failed: {e}", exc_info=True)
-        return HealthResponse(
+        return HealthResponse.model_construct(
             status="unhealthy",
             game="mines",
             database="disconnected",
             last_data_update=None,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=_now_iso
         )
 
 
@@ -841,4 +1367,5 @@ if __name__ == "__main__":
     import uvicorn
 
     logger.info("Starting Mines Tracker API server...")
-    uvicorn.run(app, host="0.0.0.0", port=8003)
+    # uvloop and httptools ship with uvicorn[standard]
+    uvicorn.run(app, host="0.0.0.0", port=8003, loop="uvloop", http="httptools")
@@ -17,15 +17,17 @@ Version: 1.0.0
 """
 
 import asyncio
-import json
+import functools
 import logging
 import os
-import hashlib
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import random
+import time
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
 
 import aiosqlite
-from playwright.async_api import async_playwright, Page, WebSocket
+import numpy as np
+import orjson
+from playwright.async_api import async_playwright, Page, Route, WebSocket
 
 
 # =============================================================================
@@ -66,26 +68,80 @@ logger = setup_logger(__name__)
 
 DATABASE_PATH: str = os.getenv("DATABASE_PATH", "mines.db")
 
+# SQLite settings applied once to the collector's long-lived connection
+DB_PRAGMAS: List[str] = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=1073741824",
+    "PRAGMA busy_timeout=3000",
+]
+
+# Maximum rounds the writer task commits in a single transaction
+WRITE_BATCH_SIZE: int = 500
+
+# round_ids quoted when a batch is dropped (the log line states the count)
+DROPPED_IDS_LOGGED: int = 5
+
+# Chromium flags for a headless, data-only session
+CHROMIUM_ARGS: List[str] = ["--disable-gpu", "--disable-dev-shm-usage"]
+
+# Opt-in only: disables Chromium's process sandbox, which root-in-container
+# setups may need. Leave unset elsewhere; the collector loads an untrusted page.
+CHROMIUM_NO_SANDBOX: bool = os.getenv("CHROMIUM_NO_SANDBOX", "").lower() in (
+    "1", "true", "yes"
+)
+if CHROMIUM_NO_SANDBOX:
+    CHROMIUM_ARGS.append("--no-sandbox")
+
+# Resource types the game page never needs for its WebSocket feed
+BLOCKED_RESOURCE_TYPES: FrozenSet[str] = frozenset({"image", "font", "media", "stylesheet"})
+
+# Maximum WebSocket frames processed per drain of the frame queue
+FRAME_BATCH_SIZE: int = 256
+
+# A message followed by its nested 'result'/'data' payloads (see _flatten)
+MessageLevels = Tuple[Dict[str, Any], ...]
+
+# Row layout for bulk inserts:
+# (round_id, mines_count, gems_revealed, cashout_multiplier, won)
+RoundRow = Tuple[str, int, int, float, bool]
+
+INSERT_ROUND_SQL: str = """INSERT OR IGNORE INTO mines_rounds
+   (round_id, mines_count, gems_revealed, cashout_multiplier, won)
+   VALUES (?, ?, ?, ?, ?)"""
+
 # Known field names for mine count extraction
-MINE_COUNT_FIELDS: List[str] = [
+MINE_COUNT_FIELDS: Tuple[str, ...] = (
     'mines', 'minesCount', 'mine_count', 'mineCount', 'numMines'
-]
+)
+_MINE_COUNT_FIELD_SET: FrozenSet[str] = frozenset(MINE_COUNT_FIELDS)
 
 # Known field names for gems revealed extraction
-GEMS_FIELDS: List[str] = [
+GEMS_FIELDS: Tuple[str, ...] = (
     'gems', 'gemsRevealed', 'gems_revealed', 'revealed', 'safe_tiles'
-]
+)
+_GEMS_FIELD_SET: FrozenSet[str] = frozenset(GEMS_FIELDS)
 
 # Known field names for multiplier extraction
-MULTIPLIER_FIELDS: List[str] = [
+MULTIPLIER_FIELDS: Tuple[str, ...] = (
     'multiplier', 'payout', 'cashout', 'coefficient', 'odds'
-]
+)
+_MULTIPLIER_FIELD_SET: FrozenSet[str] = frozenset(MULTIPLIER_FIELDS)
 
 # Known field names for round ID extraction
-ROUND_ID_FIELDS: List[str] = [
+ROUND_ID_FIELDS: Tuple[str, ...] = (
     'roundId', 'gameId', 'id', 'round', 'roundNumber',
     'gameNumber', 'sessionId'
-]
+)
+_ROUND_ID_FIELD_SET: FrozenSet[str] = frozenset(ROUND_ID_FIELDS)
+
+# Known field names for message type extraction
+MESSAGE_TYPE_FIELDS: Tuple[str, ...] = (
+    'type', 't', 'action', 'event', 'messageType', 'cmd'
+)
+_MESSAGE_TYPE_FIELD_SET: FrozenSet[str] = frozenset(MESSAGE_TYPE_FIELDS)
 
 # Message types that indicate a game start
 START_MESSAGE_TYPES: List[str] = [
@@ -108,6 +164,52 @@ HISTORY_MESSAGE_TYPES: List[str] = [
 ]
 
 
+# =============================================================================
+# Field Matching
+# =============================================================================
+
+@functools.lru_cache(maxsize=512)
+def _ordered_hits(hits: FrozenSet[str], fields: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Order the candidate fields found in a message by priority.
+
+    Cached per set of hits, so repeated message shapes skip the scan.
+
+    Args:
+        hits: Candidate field names present in the message.
+        fields: All candidate field names in priority order.
+
+    Returns:
+        Tuple[str, ...]: Present fields in priority order.
+    """
+    return tuple(field for field in fields if field in hits)
+
+
+def _matching_fields(
+    data: Dict[str, Any],
+    fields: Tuple[str, ...],
+    field_set: FrozenSet[str]
+) -> Tuple[str, ...]:
+    """
+    Find which candidate fields a message contains, in priority order.
+
+    Intersects the message keys with the candidate set in C instead of
+    probing every candidate field one by one.
+
+    Args:
+        data: Message data dictionary.
+        fields: Candidate field names in priority order.
+        field_set: The same candidates as a frozenset.
+
+    Returns:
+        Tuple[str, ...]: Present fields in priority order (usually 0 or 1).
+    """
+    hits = data.keys() & field_set
+    if len(hits) <= 1:
+        return tuple(hits)
+    return _ordered_hits(frozenset(hits), fields)
+
+
 # =============================================================================
 # Custom Exceptions
 # =============================================================================
@@ -176,14 +278,32 @@ class MinesCollector:
         self.current_game: Optional[Dict[str, Any]] = None
         self.max_retries: int = max_retries
         self.retry_delay: float = retry_delay
+        self._db: Optional[aiosqlite.Connection] = None
+        self._write_queue: "asyncio.Queue[List[RoundRow]]" = asyncio.Queue()
+        self._writer: Optional[asyncio.Task] = None
+        self._frame_queue: "asyncio.Queue[Union[str, bytes]]" = asyncio.Queue()
+        self._consumer: Optional[asyncio.Task] = None
+        self._stop_event: asyncio.Event = asyncio.Event()
+
+        # Lowercased message type -> handler, filled lowest priority first so
+        # start > reveal > cashout > history if a type appears in two groups
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], None]] = {}
+        for types, handler in (
+            (HISTORY_MESSAGE_TYPES, self._handle_history),
+            (CASHOUT_MESSAGE_TYPES, self._handle_cashout),
+            (REVEAL_MESSAGE_TYPES, self._handle_tile_reveal),
+            (START_MESSAGE_TYPES, self._handle_game_start),
+        ):
+            self._dispatch.update((t.lower(), handler) for t in types)
 
         logger.info(f"MinesCollector initialized with db_path={self.db_path}")
 
     async def init_db(self) -> None:
         """
-        Initialize the database schema.
+        Open the collector's database connection and initialize the schema.
 
-        Creates the mines_rounds table if it doesn't exist.
+        The connection is kept on self._db for the collector's lifetime and
+        closed by close(). Creates the mines_rounds table if it doesn't exist.
 
         Raises:
             DatabaseError: If database initialization fails.
@@ -191,34 +311,129 @@ class MinesCollector:
         logger.info("Initializing database...")
 
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    CREATE TABLE IF NOT EXISTS mines_rounds (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        round_id TEXT UNIQUE NOT NULL,
-                        mines_count INTEGER NOT NULL,
-                        gems_revealed INTEGER NOT NULL,
-                        cashout_multiplier REAL NOT NULL,
-                        won BOOLEAN NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                await db.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_created ON mines_rounds(created_at DESC)"
+            if self._db is None:
+                self._db = await aiosqlite.connect(self.db_path)
+                await self._db.executescript("; ".join(DB_PRAGMAS) + ";")
+
+            await self._db.execute("""
+                CREATE TABLE IF NOT EXISTS mines_rounds (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    round_id TEXT UNIQUE NOT NULL,
+                    mines_count INTEGER NOT NULL,
+                    gems_revealed INTEGER NOT NULL,
+                    cashout_multiplier REAL NOT NULL,
+                    won BOOLEAN NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
-                await db.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_mines_count ON mines_rounds(mines_count)"
-                )
-                await db.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_won ON mines_rounds(won)"
-                )
-                await db.commit()
-                logger.info("Database initialized successfully")
+            """)
+            # Nothing queries by mines_count or won any more (the API reads
+            # trigger-maintained roll-ups), and idx_created is a prefix of the
+            # API's covering idx_rounds_page, so these indexes would only add
+            # B-tree maintenance to every insert
+            await self._db.execute("DROP INDEX IF EXISTS idx_created")
+            await self._db.execute("DROP INDEX IF EXISTS idx_mines_count")
+            await self._db.execute("DROP INDEX IF EXISTS idx_won")
+            await self._db.commit()
+            logger.info("Database initialized successfully")
         except aiosqlite.Error as e:
             logger.error(f"Database initialization failed: {e}", exc_info=True)
             raise DatabaseError(f"Failed to initialize database: {e}") from e
 
-    async def save_round(
+    @staticmethod
+    def _validate_round(
+        mines_count: int,
+        gems_revealed: int,
+        cashout_multiplier: float
+    ) -> None:
+        """
+        Validate round values before they are written.
+
+        Args:
+            mines_count: Number of mines in the game.
+            gems_revealed: Number of gems successfully revealed.
+            cashout_multiplier: Cashout multiplier value.
+
+        Raises:
+            ValueError: If any value is out of range.
+        """
+        # One compare chain on the hot path; callers log the failure
+        if not (1 <= mines_count <= 24 and 0 <= gems_revealed <= 24
+                and cashout_multiplier >= 0):
+            raise ValueError(
+                "Round out of range (mines 1-24, gems 0-24, multiplier >= 0): "
+                f"mines={mines_count}, gems={gems_revealed}, "
+                f"multiplier={cashout_multiplier}"
+            )
+
+    async def save_rounds(self, rows: List[RoundRow]) -> int:
+        """
+        Save many game rounds with one executemany and a single commit.
+
+        Rows are expected to be validated already (see _validate_round).
+
+        Args:
+            rows: Round tuples in RoundRow layout.
+
+        Returns:
+            int: Number of rows inserted (duplicates are ignored).
+
+        Raises:
+            DatabaseError: If init_db() has not been called.
+        """
+        if not rows:
+            return 0
+
+        if self._db is None:
+            raise DatabaseError("Database not initialized; call init_db() first")
+
+        try:
+            cursor = await self._db.executemany(INSERT_ROUND_SQL, rows)
+            await self._db.commit()
+            inserted = max(cursor.rowcount, 0)
+            self.rounds_collected += inserted
+            logger.info(
+                "Saved batch of %d rounds (%d new), total_collected=%d",
+                len(rows), inserted, self.rounds_collected
+            )
+            return inserted
+        except aiosqlite.Error as e:
+            logger.error(
+                "Failed to save batch of %d rounds, dropped round_ids starting %s: %s",
+                len(rows), [row[0] for row in rows[:DROPPED_IDS_LOGGED]], e
+            )
+            await self._db.rollback()
+            return 0
+
+    def _round_row(
+        self,
+        round_id: str,
+        mines_count: int,
+        gems_revealed: int,
+        cashout_multiplier: float,
+        won: bool
+    ) -> Optional[RoundRow]:
+        """
+        Validate a round and pack it in RoundRow layout.
+
+        Args:
+            round_id: Unique identifier for the round.
+            mines_count: Number of mines in the game.
+            gems_revealed: Number of gems successfully revealed.
+            cashout_multiplier: Cashout multiplier value.
+            won: Whether the player won (cashed out) or lost (hit mine).
+
+        Returns:
+            Optional[RoundRow]: The row, or None if the round was invalid.
+        """
+        try:
+            self._validate_round(mines_count, gems_revealed, cashout_multiplier)
+        except ValueError as e:
+            logger.warning(f"Skipping invalid round {round_id}: {e}")
+            return None
+
+        return (round_id, mines_count, gems_revealed, cashout_multiplier, won)
+
+    def queue_round(
         self,
         round_id: str,
         mines_count: int,
@@ -227,7 +442,7 @@ class MinesCollector:
         won: bool
     ) -> bool:
         """
-        Save a game round to the database.
+        Validate a round and queue it for the writer task.
 
         Args:
             round_id: Unique identifier for the round.
@@ -237,46 +452,85 @@ class MinesCollector:
             won: Whether the player won (cashed out) or lost (hit mine).
 
         Returns:
-            bool: True if round was saved successfully, False otherwise.
+            bool: True if the round was queued, False if it was invalid.
+        """
+        row = self._round_row(
+            round_id, mines_count, gems_revealed, cashout_multiplier, won
+        )
+        if row is None:
+            return False
 
-        Raises:
-            ValueError: If parameters are invalid.
+        self._write_queue.put_nowait([row])
+        return True
+
+    def queue_rounds(self, rows: List[RoundRow]) -> None:
         """
-        # Validate parameters
-        if mines_count < 1 or mines_count > 24:
-            logger.error(f"Invalid mines_count: {mines_count} (must be 1-24)")
-            raise ValueError(f"Mines count must be 1-24, got {mines_count}")
+        Queue already-validated rounds to be committed together.
 
-        if gems_revealed < 0 or gems_revealed > 24:
-            logger.error(f"Invalid gems_revealed: {gems_revealed} (must be 0-24)")
-            raise ValueError(f"Gems revealed must be 0-24, got {gems_revealed}")
+        The writer never splits a queued batch, so all of rows go into the
+        database with one executemany and one commit.
 
-        if cashout_multiplier < 0:
-            logger.error(f"Invalid cashout_multiplier: {cashout_multiplier} (must be >= 0)")
-            raise ValueError(f"Cashout multiplier must be >= 0, got {cashout_multiplier}")
+        Args:
+            rows: Round tuples in RoundRow layout.
+        """
+        if rows:
+            self._write_queue.put_nowait(rows)
 
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    """INSERT OR IGNORE INTO mines_rounds
-                       (round_id, mines_count, gems_revealed, cashout_multiplier, won)
-                       VALUES (?, ?, ?, ?, ?)""",
-                    (round_id, mines_count, gems_revealed, cashout_multiplier, won)
-                )
-                await db.commit()
-                self.rounds_collected += 1
-                logger.info(
-                    f"Round saved: round_id={round_id}, mines={mines_count}, "
-                    f"gems={gems_revealed}, multiplier={cashout_multiplier:.2f}x, "
-                    f"won={won}, total_collected={self.rounds_collected}"
+    def _take_queued_rounds(self, rows: List[RoundRow]) -> int:
+        """
+        Move already-queued batches into rows without waiting.
+
+        Stops once rows holds WRITE_BATCH_SIZE rounds or the queue is empty.
+
+        Args:
+            rows: Rows to extend in place.
+
+        Returns:
+            int: Number of queued batches taken.
+        """
+        taken = 0
+        while len(rows) < WRITE_BATCH_SIZE:
+            try:
+                rows.extend(self._write_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+            taken += 1
+        return taken
+
+    async def _writer_loop(self) -> None:
+        """
+        Sole writer of live rounds.
+
+        Waits for one queued batch, drains whatever else is already queued
+        (up to WRITE_BATCH_SIZE rounds) and commits it with one executemany,
+        so handlers never race each other for the SQLite write lock.
+
+        A failed batch is logged and dropped; the loop keeps running and
+        always marks its batches done, so run() can never wait forever on
+        the queue.
+        """
+        while True:
+            rows = list(await self._write_queue.get())
+            taken = 1 + self._take_queued_rounds(rows)
+            try:
+                await self.save_rounds(rows)
+            except Exception as e:
+                logger.error(
+                    "Writer dropped batch of %d rounds, round_ids starting %s: %s",
+                    len(rows), [row[0] for row in rows[:DROPPED_IDS_LOGGED]], e
                 )
-                return True
-        except aiosqlite.IntegrityError:
-            logger.debug(f"Round {round_id} already exists (duplicate)")
-            return False
-        except aiosqlite.Error as e:
-            logger.error(f"Failed to save round {round_id}: {e}", exc_info=True)
-            return False
+            finally:
+                for _ in range(taken):
+                    self._write_queue.task_done()
+
+    async def close(self) -> None:
+        """
+        Close the collector's database connection if it is open.
+        """
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+            logger.info("Database connection closed")
 
     async def collect_with_playwright(self, demo_url: str) -> None:
         """
@@ -298,15 +552,17 @@ class MinesCollector:
         while self.running and retry_count < self.max_retries:
             try:
                 async with async_playwright() as p:
-                    browser = await p.chromium.launch(headless=True)
+                    browser = await p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
                     context = await browser.new_context(
                         viewport={"width": 1920, "height": 1080},
                         user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                     )
+                    # Skip assets so "networkidle" is reached sooner on every reconnect
+                    await context.route("**/*", self._route_request)
                     page = await context.new_page()
 
                     # Set up WebSocket message handler
-                    page.on("websocket", lambda ws: self._setup_websocket_handler(ws))
+                    page.on("websocket", self._setup_websocket_handler)
 
                     try:
                         await page.goto(demo_url, wait_until="networkidle", timeout=60000)
@@ -315,9 +571,8 @@ class MinesCollector:
                         # Reset retry count on successful connection
                         retry_count = 0
 
-                        # Keep collecting while running
-                        while self.running:
-                            await asyncio.sleep(1)
+                        # Idle until stop() is called; frames arrive via callbacks
+                        await self._stop_event.wait()
 
                     except Exception as e:
                         logger.error(f"Page navigation error: {e}", exc_info=True)
@@ -344,6 +599,19 @@ class MinesCollector:
                         f"Failed to connect after {self.max_retries} attempts"
                     ) from e
 
+    @staticmethod
+    async def _route_request(route: Route) -> None:
+        """
+        Abort requests for resource types in BLOCKED_RESOURCE_TYPES.
+
+        Args:
+            route: Playwright route for the intercepted request.
+        """
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
     def _setup_websocket_handler(self, ws: WebSocket) -> None:
         """
         Set up handlers for WebSocket message events.
@@ -353,30 +621,69 @@ class MinesCollector:
         """
         logger.info(f"WebSocket connected: {ws.url}")
 
-        def on_message(payload: str) -> None:
-            """Handle incoming WebSocket message."""
-            try:
-                self._process_websocket_message(payload)
-            except Exception as e:
-                logger.error(f"Error processing WebSocket message: {e}", exc_info=True)
+        # Bound methods, so no closures are built per connection
+        ws.on("framereceived", self._on_frame)
+        ws.on("close", self._on_ws_close)
 
-        ws.on("framereceived", lambda payload: on_message(payload))
-        ws.on("close", lambda: logger.info(f"WebSocket closed: {ws.url}"))
+    def _on_frame(self, payload: Union[str, bytes]) -> None:
+        """
+        Queue an incoming WebSocket frame for the batch consumer.
+
+        Args:
+            payload: Raw frame payload.
+        """
+        self._frame_queue.put_nowait(payload)
+
+    @staticmethod
+    def _on_ws_close(ws: WebSocket) -> None:
+        """
+        Log a closed WebSocket.
+
+        Args:
+            ws: Playwright WebSocket object that closed.
+        """
+        logger.info(f"WebSocket closed: {ws.url}")
 
-    def _process_websocket_message(self, message: str) -> None:
+    async def _drain_frames(self) -> None:
+        """
+        Consume queued WebSocket frames in batches.
+
+        Waits for one frame, then drains up to FRAME_BATCH_SIZE frames that
+        are already queued without yielding, so bursts of small frames are
+        handled in one pass instead of one event-loop wakeup per frame.
+        """
+        while True:
+            batch = [await self._frame_queue.get()]
+            while len(batch) < FRAME_BATCH_SIZE:
+                try:
+                    batch.append(self._frame_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            for payload in batch:
+                try:
+                    self._process_websocket_message(payload)
+                except Exception as e:
+                    logger.error(f"Error processing WebSocket message: {e}")
+
+    def _process_websocket_message(self, message: Union[str, bytes]) -> None:
         """
         Process a raw WebSocket message.
 
         Args:
-            message: Raw WebSocket message string.
+            message: Raw WebSocket message, text or binary (parsed as-is).
         """
         try:
-            data = json.loads(message) if isinstance(message, str) else message
+            if isinstance(message, (str, bytes, bytearray)):
+                data = orjson.loads(message)
+            else:
+                data = message
             self.parse_ws_message(data)
-        except json.JSONDecodeError as e:
-            logger.debug(f"Non-JSON message received: {message[:100]}...")
+        except orjson.JSONDecodeError:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Non-JSON message received: {message[:100]}...")
         except Exception as e:
-            logger.error(f"Failed to process message: {e}", exc_info=True)
+            logger.error(f"Failed to process message: {e}")
 
     def parse_ws_message(self, data: Union[Dict[str, Any], List, Any]) -> None:
         """
@@ -397,22 +704,13 @@ class MinesCollector:
             return
 
         msg_type = self._extract_message_type(data)
+        if not msg_type:
+            return
 
-        # Game start
-        if msg_type and msg_type.lower() in START_MESSAGE_TYPES:
-            self._handle_game_start(data)
-
-        # Tile revealed
-        elif msg_type and msg_type.lower() in REVEAL_MESSAGE_TYPES:
-            self._handle_tile_reveal(data)
-
-        # Cash out
-        elif msg_type and msg_type.lower() in CASHOUT_MESSAGE_TYPES:
-            self._handle_cashout(data)
-
-        # History data
-        elif msg_type and msg_type.lower() in HISTORY_MESSAGE_TYPES:
-            self._handle_history(data)
+        # Game start / tile reveal / cash out / history, in one lookup
+        handler = self._dispatch.get(msg_type.lower())
+        if handler:
+            handler(data)
 
     def _handle_game_start(self, data: Dict[str, Any]) -> None:
         """
@@ -421,8 +719,9 @@ class MinesCollector:
         Args:
             data: Message data dictionary.
         """
-        round_id = self._extract_round_id(data) or self._generate_round_id()
-        mines_count = self._extract_mine_count(data) or 3
+        levels = self._flatten(data)
+        round_id = self._extract_round_id(levels) or self._generate_round_id()
+        mines_count = self._extract_mine_count(levels) or 3
 
         self.current_game = {
             "id": round_id,
@@ -432,7 +731,7 @@ class MinesCollector:
             "hash": data.get("hash")
         }
 
-        logger.info(f"New game started: round_id={round_id}, mines={mines_count}")
+        logger.info("New game started: round_id=%s, mines=%d", round_id, mines_count)
 
     def _handle_tile_reveal(self, data: Dict[str, Any]) -> None:
         """
@@ -453,18 +752,21 @@ class MinesCollector:
             self.current_game["gems_revealed"] += 1
             if position is not None:
                 self.current_game["reveals"].append(position)
-            logger.debug(f"Gem revealed at position {position}, total: {self.current_game['gems_revealed']}")
+            logger.debug(
+                "Gem revealed at position %s, total: %d",
+                position, self.current_game["gems_revealed"]
+            )
         else:
             # Hit a mine - game over
-            logger.info(f"Mine hit! Game over: gems_revealed={self.current_game['gems_revealed']}")
-            asyncio.create_task(
-                self.save_round(
-                    round_id=str(self.current_game["id"]),
-                    mines_count=self.current_game["mine_count"],
-                    gems_revealed=self.current_game["gems_revealed"],
-                    cashout_multiplier=0.0,
-                    won=False
-                )
+            logger.info(
+                "Mine hit! Game over: gems_revealed=%d", self.current_game["gems_revealed"]
+            )
+            self.queue_round(
+                round_id=str(self.current_game["id"]),
+                mines_count=self.current_game["mine_count"],
+                gems_revealed=self.current_game["gems_revealed"],
+                cashout_multiplier=0.0,
+                won=False
             )
             self.current_game = None
 
@@ -479,17 +781,18 @@ class MinesCollector:
             logger.debug("Cashout received but no active game")
             return
 
-        multiplier = self._extract_multiplier(data) or 1.0
+        multiplier = self._extract_multiplier(self._flatten(data)) or 1.0
 
-        logger.info(f"Cashout: gems_revealed={self.current_game['gems_revealed']}, multiplier={multiplier:.2f}x")
-        asyncio.create_task(
-            self.save_round(
-                round_id=str(self.current_game["id"]),
-                mines_count=self.current_game["mine_count"],
-                gems_revealed=self.current_game["gems_revealed"],
-                cashout_multiplier=multiplier,
-                won=True
-            )
+        logger.info(
+            "Cashout: gems_revealed=%d, multiplier=%.2fx",
+            self.current_game["gems_revealed"], multiplier
+        )
+        self.queue_round(
+            round_id=str(self.current_game["id"]),
+            mines_count=self.current_game["mine_count"],
+            gems_revealed=self.current_game["gems_revealed"],
+            cashout_multiplier=multiplier,
+            won=True
         )
         self.current_game = None
 
@@ -497,27 +800,59 @@ class MinesCollector:
         """
         Handle game history message.
 
+        All valid games in the message are queued as one batch so a history
+        dump lands in a single transaction.
+
         Args:
             data: Message data dictionary.
         """
         games = data.get("games") or data.get("history") or []
 
+        rows: List[RoundRow] = []
         for game in games:
-            round_id = self._extract_round_id(game) or self._generate_round_id()
-            mines_count = self._extract_mine_count(game) or 3
-            gems_revealed = self._extract_gems_revealed(game) or 0
-            multiplier = self._extract_multiplier(game) or 0.0
+            levels = self._flatten(game)
+            round_id = self._extract_round_id(levels) or self._generate_round_id()
+            mines_count = self._extract_mine_count(levels) or 3
+            gems_revealed = self._extract_gems_revealed(levels) or 0
+            multiplier = self._extract_multiplier(levels) or 0.0
             won = game.get("won") or game.get("cashed_out") or multiplier > 0
 
-            asyncio.create_task(
-                self.save_round(
-                    round_id=str(round_id),
-                    mines_count=mines_count,
-                    gems_revealed=gems_revealed,
-                    cashout_multiplier=multiplier,
-                    won=bool(won)
-                )
+            row = self._round_row(
+                round_id=str(round_id),
+                mines_count=mines_count,
+                gems_revealed=gems_revealed,
+                cashout_multiplier=multiplier,
+                won=bool(won)
             )
+            if row is not None:
+                rows.append(row)
+
+        self.queue_rounds(rows)
+
+    @staticmethod
+    def _flatten(data: Dict[str, Any]) -> MessageLevels:
+        """
+        Unroll the nested 'result'/'data' payloads of a message into a chain.
+
+        Done once per message so the extractors can walk a flat tuple instead
+        of recursing. At each level 'result' is followed if it is a dict,
+        otherwise 'data'.
+
+        Args:
+            data: Message data dictionary.
+
+        Returns:
+            MessageLevels: The message followed by each nested payload.
+        """
+        levels = [data]
+        while True:
+            nested = data.get('result')
+            if not isinstance(nested, dict):
+                nested = data.get('data')
+                if not isinstance(nested, dict):
+                    return tuple(levels)
+            levels.append(nested)
+            data = nested
 
     def _extract_message_type(self, data: Dict[str, Any]) -> Optional[str]:
         """
@@ -529,23 +864,22 @@ class MinesCollector:
         Returns:
             Optional[str]: Message type if found, None otherwise.
         """
-        for field in ['type', 't', 'action', 'event', 'messageType', 'cmd']:
-            if field in data:
-                return str(data[field])
+        for field in _matching_fields(data, MESSAGE_TYPE_FIELDS, _MESSAGE_TYPE_FIELD_SET):
+            return str(data[field])
         return None
 
-    def _extract_mine_count(self, data: Dict[str, Any]) -> Optional[int]:
+    def _extract_mine_count(self, levels: MessageLevels) -> Optional[int]:
         """
-        Extract mine count from data dictionary.
+        Extract mine count from a message or its nested payloads.
 
         Args:
-            data: Message data dictionary.
+            levels: Message levels from _flatten(), searched in order.
 
         Returns:
             Optional[int]: Mine count if found and valid, None otherwise.
         """
-        for field in MINE_COUNT_FIELDS:
-            if field in data:
+        for data in levels:
+            for field in _matching_fields(data, MINE_COUNT_FIELDS, _MINE_COUNT_FIELD_SET):
                 try:
                     value = data[field]
                     if isinstance(value, int):
@@ -556,27 +890,20 @@ class MinesCollector:
                     logger.debug(f"Failed to convert {field}={data[field]} to int: {e}")
                     continue
 
-        # Check nested structures
-        if 'result' in data and isinstance(data['result'], dict):
-            return self._extract_mine_count(data['result'])
-
-        if 'data' in data and isinstance(data['data'], dict):
-            return self._extract_mine_count(data['data'])
-
         return None
 
-    def _extract_gems_revealed(self, data: Dict[str, Any]) -> Optional[int]:
+    def _extract_gems_revealed(self, levels: MessageLevels) -> Optional[int]:
         """
-        Extract gems revealed from data dictionary.
+        Extract gems revealed from a message or its nested payloads.
 
         Args:
-            data: Message data dictionary.
+            levels: Message levels from _flatten(), searched in order.
 
         Returns:
             Optional[int]: Gems revealed if found and valid, None otherwise.
         """
-        for field in GEMS_FIELDS:
-            if field in data:
+        for data in levels:
+            for field in _matching_fields(data, GEMS_FIELDS, _GEMS_FIELD_SET):
                 try:
                     value = data[field]
                     if isinstance(value, int):
@@ -587,27 +914,20 @@ class MinesCollector:
                     logger.debug(f"Failed to convert {field}={data[field]} to int: {e}")
                     continue
 
-        # Check nested structures
-        if 'result' in data and isinstance(data['result'], dict):
-            return self._extract_gems_revealed(data['result'])
-
-        if 'data' in data and isinstance(data['data'], dict):
-            return self._extract_gems_revealed(data['data'])
-
         return None
 
-    def _extract_multiplier(self, data: Dict[str, Any]) -> Optional[float]:
+    def _extract_multiplier(self, levels: MessageLevels) -> Optional[float]:
         """
-        Extract multiplier value from data dictionary.
+        Extract multiplier value from a message or its nested payloads.
 
         Args:
-            data: Message data dictionary.
+            levels: Message levels from _flatten(), searched in order.
 
         Returns:
             Optional[float]: Multiplier value if found and valid, None otherwise.
         """
-        for field in MULTIPLIER_FIELDS:
-            if field in data:
+        for data in levels:
+            for field in _matching_fields(data, MULTIPLIER_FIELDS, _MULTIPLIER_FIELD_SET):
                 try:
                     value = data[field]
                     if isinstance(value, (int, float)):
@@ -618,36 +938,22 @@ class MinesCollector:
                     logger.debug(f"Failed to convert {field}={data[field]} to float: {e}")
                     continue
 
-        # Check nested structures
-        if 'result' in data and isinstance(data['result'], dict):
-            return self._extract_multiplier(data['result'])
-
-        if 'data' in data and isinstance(data['data'], dict):
-            return self._extract_multiplier(data['data'])
-
         return None
 
-    def _extract_round_id(self, data: Dict[str, Any]) -> Optional[str]:
+    def _extract_round_id(self, levels: MessageLevels) -> Optional[str]:
         """
-        Extract round ID from data dictionary.
+        Extract round ID from a message or its nested payloads.
 
         Args:
-            data: Message data dictionary.
+            levels: Message levels from _flatten(), searched in order.
 
         Returns:
             Optional[str]: Round ID if found, None otherwise.
         """
-        for field in ROUND_ID_FIELDS:
-            if field in data:
+        for data in levels:
+            for field in _matching_fields(data, ROUND_ID_FIELDS, _ROUND_ID_FIELD_SET):
                 return str(data[field])
 
-        # Check nested structures
-        if 'result' in data and isinstance(data['result'], dict):
-            return self._extract_round_id(data['result'])
-
-        if 'data' in data and isinstance(data['data'], dict):
-            return self._extract_round_id(data['data'])
-
         return None
 
     def _generate_round_id(self) -> str:
@@ -655,70 +961,61 @@ class MinesCollector:
         Generate a unique round ID.
 
         Returns:
-            str: Generated round ID.
+            str: Generated round ID (nanosecond clock in hex plus 24 random bits).
         """
-        timestamp = datetime.now().isoformat()
-        return hashlib.md5(timestamp.encode()).hexdigest()[:12]
+        return f"{time.time_ns():x}{random.getrandbits(24):06x}"
 
     async def generate_test_data(self, count: int = 100) -> None:
         """
         Generate test data for development and testing.
 
-        Creates simulated Mines game rounds with realistic distribution.
+        Creates simulated Mines game rounds with realistic distribution,
+        built in memory and written with a single batched insert.
 
         Args:
             count: Number of test rounds to generate.
         """
-        import random
-
         logger.info(f"Generating {count} test rounds...")
 
-        for i in range(count):
-            # Random mine count (weighted towards 3-5 mines)
-            mines_count = random.choices(
-                [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-                weights=[5, 10, 30, 25, 15, 7, 4, 2, 1, 1]
-            )[0]
-
-            # Calculate safe tiles
-            safe_tiles = 25 - mines_count
-
-            # Simulate player revealing tiles
-            # ~50% chance to hit mine, ~50% chance to cash out
-            hit_mine = random.random() < 0.5
-
-            if hit_mine:
-                # Hit a mine - reveal 0 to safe_tiles gems
-                gems_revealed = random.randint(0, min(safe_tiles, 8))
-                cashout_multiplier = 0.0
-                won = False
-            else:
-                # Cash out - reveal 1 to safe_tiles gems
-                gems_revealed = random.randint(1, min(safe_tiles, 10))
-                # Calculate multiplier based on probability
-                prob = 1.0
-                for j in range(gems_revealed):
-                    prob *= (safe_tiles - j) / (25 - j)
-                cashout_multiplier = round(0.97 / prob, 2)
-                won = True
+        rng = np.random.default_rng()
 
-            round_id = f"test_{datetime.now().timestamp()}_{i}"
+        # Random mine count (weighted towards 3-5 mines)
+        weights = np.array([5, 10, 30, 25, 15, 7, 4, 2, 1, 1], dtype=np.float64)
+        mines = rng.choice(np.arange(1, 11), size=count, p=weights / weights.sum())
+        safe_tiles = 25 - mines
 
-            try:
-                await self.save_round(
-                    round_id=round_id,
-                    mines_count=mines_count,
-                    gems_revealed=gems_revealed,
-                    cashout_multiplier=cashout_multiplier,
-                    won=won
-                )
-            except ValueError as e:
-                logger.warning(f"Skipping invalid test round: {e}")
+        # ~50% chance to hit mine, ~50% chance to cash out
+        hit_mine = rng.random(count) < 0.5
 
-            # Small delay to avoid overwhelming the database
-            await asyncio.sleep(0.01)
+        # Hit a mine: 0..min(safe, 8) gems; cash out: 1..min(safe, 10) gems
+        lost_gems = rng.integers(0, np.minimum(safe_tiles, 8) + 1)
+        won_gems = rng.integers(1, np.minimum(safe_tiles, 10) + 1)
+        gems = np.where(hit_mine, lost_gems, won_gems)
 
-        logger.info(f"Test data generation complete: {count} rounds created")
+        # survival[m - 1, g] is the chance of revealing g gems with m mines,
+        # built once by cumprod instead of a product loop per row
+        steps = np.arange(10)
+        ratios = ((25 - np.arange(1, 11))[:, None] - steps) / (25 - steps)
+        survival = np.hstack([np.ones((10, 1)), np.cumprod(ratios, axis=1)])
+        multipliers = np.where(
+            hit_mine, 0.0, np.round(0.97 / survival[mines - 1, gems], 2)
+        )
+
+        # Values are in range by construction, so rows skip _validate_round
+        run_tag = time.monotonic_ns()
+        round_ids = [f"test_{run_tag}_{i}" for i in range(count)]
+        rows: List[RoundRow] = list(zip(
+            round_ids,
+            mines.tolist(),
+            gems.tolist(),
+            multipliers.tolist(),
+            (~hit_mine).tolist(),
+        ))
+
+        # One executemany and one commit for the whole batch
+        inserted = await self.save_rounds(rows)
+
+        logger.info(f"Test data generation complete: {inserted} rounds created")
 
     async def run(
         self,
@@ -742,6 +1039,9 @@ class MinesCollector:
 
         await self.init_db()
         self.running = True
+        self._stop_event.clear()
+        self._writer = asyncio.create_task(self._writer_loop())
+        self._consumer = asyncio.create_task(self._drain_frames())
 
         try:
             if test_mode:
@@ -759,6 +1059,18 @@ class MinesCollector:
             raise
         finally:
             self.running = False
+            if self._consumer:
+                self._consumer.cancel()
+            if self._writer:
+                # Let the writer commit everything queued before stopping it,
+                # without waiting on the queue if the writer itself has ended
+                drained = asyncio.ensure_future(self._write_queue.join())
+                await asyncio.wait(
+                    {drained, self._writer}, return_when=asyncio.FIRST_COMPLETED
+                )
+                drained.cancel()
+                self._writer.cancel()
+            await self.close()
             logger.info(
                 f"Collector stopped. Total rounds collected: {self.rounds_collected}"
             )
@@ -767,11 +1079,13 @@ class MinesCollector:
         """
         Stop the collector gracefully.
 
-        Sets the running flag to False, which will cause the collection
-        loop to exit on its next iteration.
+        Clears the running flag and sets the stop event, which wakes the
+        collection loop immediately; run() then closes the database
+        connection in its finally block.
         """
         logger.info("Stop requested - collector will shut down gracefully")
         self.running = False
+        self._stop_event.set()
 
 
 # =============================================================================
@@ -799,7 +1113,10 @@ async def main() -> None:
         # Try to collect from Spribe demo
         demo_url = os.getenv("DEMO_URL", "https://demo.spribe.io/mines")
         logger.info(f"Starting collection from: {demo_url}")
-        logger.info("Note: This may require additional configuration based on Spribe's demo structure")
+        logger.info(
+            "Note: This may require additional configuration based on "
+            "Spribe's demo structure"
+        )
 
         try:
             await collector.run(demo_url=demo_url)
@@ -0,0 +1,174 @@
+"""
+Grid game statistics service tests against a real SQLite database.
+
+The service is given a small pool adapter over aiosqlite so the statistics
+paths receive genuine sqlite3.Row records, exactly as a live pool returns.
+"""
+
+import json
+import sys
+import unittest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, AsyncGenerator, List
+
+import aiosqlite
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "api"))
+
+from game_stats import GridGameStatsService  # noqa: E402
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+_SCHEMA = """
+    CREATE TABLE rounds (
+        round_id TEXT,
+        tiles_opened INTEGER,
+        steps INTEGER,
+        multiplier REAL,
+        is_win INTEGER,
+        cashout INTEGER,
+        risk_level TEXT,
+        mine_positions TEXT,
+        floor_reached INTEGER,
+        choices TEXT,
+        choice_results TEXT,
+        lanes_crossed INTEGER,
+        distance INTEGER,
+        created_at TIMESTAMP
+    )
+"""
+
+# (round_id, tiles_opened, steps, multiplier, is_win, cashout, risk_level,
+#  mine_positions, floor_reached, choices, choice_results, lanes_crossed, distance)
+# r2 leaves the primary columns NULL to exercise the COALESCE fallbacks.
+_ROUNDS = [
+    ("r1", 2, None, 1.5, 1, None, "easy", [0, 12], 2, ["left", "right"], [1, 1], 2, None),
+    ("r2", None, 5, None, None, 0, "HARD", [12], None, ["middle"], [0], None, 5),
+    ("r3", 1, None, 0.0, 0, None, None, [24], 1, ["left"], [0], 1, None),
+    ("r4", 9, None, 6.0, 1, None, "hard", [3], 9, [], [], 9, None),
+]
+
+
+class _SQLiteConnection:
+    """Exposes the fetch(query, *params) call the service expects."""
+
+    def __init__(self, db: aiosqlite.Connection) -> None:
+        self._db = db
+
+    async def fetch(self, query: str, *params: Any) -> List[aiosqlite.Row]:
+        return list(await self._db.execute_fetchall(query, params))
+
+
+class _SQLitePool:
+    """Single-connection pool with the acquire() interface of the service."""
+
+    def __init__(self, db: aiosqlite.Connection) -> None:
+        self._db = db
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[_SQLiteConnection, None]:
+        yield _SQLiteConnection(self._db)
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+class GridGameStatsServiceTest(unittest.IsolatedAsyncioTestCase):
+    """GridGameStatsService end to end on SQLite rows."""
+
+    async def asyncSetUp(self) -> None:
+        self.db = await aiosqlite.connect(":memory:")
+        self.db.row_factory = aiosqlite.Row
+        await self.db.execute(_SCHEMA)
+
+        # Distinct timestamps inside every period window
+        now = datetime.utcnow()
+        await self.db.executemany(
+            "INSERT INTO rounds VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    round_id, tiles, steps, mult, win, cashout, risk,
+                    json.dumps(mines), floor, json.dumps(choices),
+                    json.dumps(results), lanes, distance,
+                    (now - timedelta(minutes=i + 1)).isoformat(sep=" "),
+                )
+                for i, (
+                    round_id, tiles, steps, mult, win, cashout, risk,
+                    mines, floor, choices, results, lanes, distance,
+                ) in enumerate(_ROUNDS)
+            ],
+        )
+        await self.db.commit()
+        self.pool = _SQLitePool(self.db)
+
+    async def asyncTearDown(self) -> None:
+        await self.db.close()
+
+    def _service(self, game_type: str) -> GridGameStatsService:
+        service = GridGameStatsService(self.pool, game_type, game_type)
+        service.clear_cache()
+        self.addCleanup(service.clear_cache)
+        return service
+
+    async def test_rounds_columns_from_sqlite_rows(self) -> None:
+        cols = await self._service("mines").get_rounds_columns(hours=24)
+
+        # Newest first: r1, r2, r3, r4
+        self.assertEqual(cols.tiles.tolist(), [2, 5, 1, 9])
+        self.assertEqual(cols.multiplier.tolist(), [1.5, 1.0, 0.0, 6.0])
+        self.assertEqual(cols.is_win.tolist(), [True, False, False, True])
+
+    async def test_mines_statistics(self) -> None:
+        stats = await self._service("mines").get_statistics("24h")
+
+        tiles = stats.tile_analysis
+        self.assertEqual(tiles.total_rounds, 4)
+        self.assertEqual(tiles.avg_tiles_opened, 4.25)
+        self.assertEqual(tiles.avg_multiplier, 2.125)
+        self.assertEqual(tiles.median_tiles, 3.5)
+        self.assertEqual(tiles.max_tiles_opened, 9)
+        self.assertEqual(tiles.early_cashout_rate, 50.0)
+        self.assertEqual(tiles.mid_cashout_rate, 0)
+        self.assertEqual(tiles.late_cashout_rate, 50.0)
+        self.assertEqual(tiles.first_tile_fail_rate, 50.0)
+        self.assertEqual(tiles.avg_tiles_before_fail, 3.0)
+
+        levels = {s.risk_level: s for s in stats.risk_level_comparison}
+        self.assertEqual(sorted(levels), ["easy", "hard", "medium"])
+        self.assertEqual(levels["hard"].total_rounds, 2)
+        self.assertEqual(levels["hard"].avg_multiplier, 3.5)
+        self.assertEqual(levels["hard"].big_win_rate, 50.0)
+
+        heatmap = stats.position_heatmap
+        self.assertEqual(heatmap.mine_count_analyzed, 5)
+        self.assertEqual(heatmap.position_frequency[12], 40.0)
+        self.assertEqual(heatmap.riskiest_positions[-1], 12)
+
+    async def test_towers_and_chicken_road_statistics(self) -> None:
+        floors = (await self._service("towers").get_statistics("24h")).floor_analysis
+        self.assertEqual(floors.total_rounds, 4)
+        self.assertEqual(floors.max_floor_reached, 9)
+        self.assertEqual(floors.left_success_rate, 50.0)
+        self.assertEqual(floors.middle_success_rate, 0.0)
+        self.assertEqual(floors.right_success_rate, 100.0)
+
+        lanes = (await self._service("chickenroad").get_statistics("24h")).lane_analysis
+        self.assertEqual(lanes.total_rounds, 4)
+        self.assertEqual(lanes.max_distance, 9)
+        self.assertEqual(lanes.caught_early_rate, 50.0)
+
+    async def test_cached_call_accepts_keyword_period(self) -> None:
+        service = self._service("mines")
+        by_keyword = await service.get_statistics(period="24h")
+        self.assertIs(await service.get_statistics(period="24h"), by_keyword)
+        self.assertEqual(by_keyword.tile_analysis.total_rounds, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+"""
+Mines Tracker API tests against real SQLite databases.
+"""
+
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "api"))
+
+import main  # noqa: E402
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+_INSERT_ROUND = """
+    INSERT OR IGNORE INTO mines_rounds
+        (round_id, mines_count, gems_revealed, cashout_multiplier, won, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _rounds(start: int, count: int) -> List[Tuple]:
+    """Deterministic rounds r{start}..r{start + count - 1}."""
+    return [
+        (
+            f"r{i}",
+            1 + i % 24,
+            i % 7,
+            round(1 + (i % 13) * 0.37, 2) if i % 3 else 0.0,
+            bool(i % 3),
+            f"2026-01-01 00:{i // 60 % 60:02d}:{i % 60:02d}",
+        )
+        for i in range(start, start + count)
+    ]
+
+
+# =============================================================================
+# Roll-up Aggregates
+# =============================================================================
+
+class RollupTest(unittest.TestCase):
+    """mines_stats and mines_by_count stay equal to a fresh aggregate."""
+
+    def setUp(self) -> None:
+        self.db = sqlite3.connect(":memory:", isolation_level=None)
+        self.db.executescript(main._SQL_SCHEMA)
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def _startup(self) -> None:
+        self.db.executescript(main._SQL_AGGREGATE_SCHEMA)
+
+    def _insert(self, rows: List[Tuple]) -> None:
+        self.db.execute("BEGIN")
+        self.db.executemany(_INSERT_ROUND, rows)
+        self.db.execute("COMMIT")
+
+    def assertRollupsMatchTable(self) -> None:
+        stats = self.db.execute(
+            "SELECT total, sum_gems, wins, sum_cashout_win, count_cashout_win "
+            "FROM mines_stats WHERE id = 1"
+        ).fetchone()
+        fresh = self.db.execute(
+            """
+            SELECT COUNT(*),
+                   COALESCE(SUM(gems_revealed), 0),
+                   COALESCE(SUM(CASE WHEN won THEN 1 ELSE 0 END), 0),
+                   COALESCE(SUM(CASE WHEN won THEN cashout_multiplier ELSE 0 END), 0),
+                   COALESCE(SUM(CASE WHEN won THEN 1 ELSE 0 END), 0)
+            FROM mines_rounds
+            """
+        ).fetchone()
+        self.assertEqual(stats[:3], fresh[:3])
+        self.assertAlmostEqual(stats[3], fresh[3], places=6)
+        self.assertEqual(stats[4], fresh[4])
+
+        by_count = self.db.execute(
+            "SELECT mines_count, cnt FROM mines_by_count WHERE cnt > 0 ORDER BY mines_count"
+        ).fetchall()
+        fresh_by_count = self.db.execute(
+            "SELECT mines_count, COUNT(*) FROM mines_rounds "
+            "GROUP BY mines_count ORDER BY mines_count"
+        ).fetchall()
+        self.assertEqual(by_count, fresh_by_count)
+
+    def test_backfill_covers_existing_rows(self) -> None:
+        self._insert(_rounds(0, 500))
+        self._startup()
+        self.assertRollupsMatchTable()
+
+    def test_trigger_tracks_inserts(self) -> None:
+        self._startup()
+        self.assertRollupsMatchTable()
+
+        self._insert(_rounds(0, 300))
+        self._insert(_rounds(300, 1))
+        self.assertRollupsMatchTable()
+
+    def test_ignored_duplicates_are_not_counted(self) -> None:
+        self._startup()
+        self._insert(_rounds(0, 100))
+        self._insert(_rounds(50, 100))
+        self.assertEqual(
+            self.db.execute("SELECT total FROM mines_stats").fetchone()[0], 150
+        )
+        self.assertRollupsMatchTable()
+
+    def test_restart_does_not_backfill_again(self) -> None:
+        self._insert(_rounds(0, 200))
+        self._startup()
+        self._insert(_rounds(200, 200))
+        self._startup()
+        self.assertRollupsMatchTable()
+
+
+# =============================================================================
+# Keyset Pagination
+# =============================================================================
+
+class PaginationTest(unittest.TestCase):
+    """GET /api/rounds cursor walks over a file database."""
+
+    # Three timestamps shared by several rows each, so ties on created_at
+    # must be broken by id
+    ROWS = [
+        (f"t{i}", 3, 1, 1.5, True, f"2026-01-01 00:00:0{i % 3}")
+        for i in range(10)
+    ]
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        db_path = str(Path(tmp.name) / "mines.db")
+
+        for target in (main.db_manager, main.db_pool):
+            original = target.db_path
+            target.db_path = db_path
+            self.addCleanup(setattr, target, "db_path", original)
+
+        # Entering the client runs the startup handler against db_path
+        self.client = self.enterContext(TestClient(main.app))
+
+        with sqlite3.connect(db_path) as db:
+            db.executemany(_INSERT_ROUND, self.ROWS)
+
+    def _page(self, limit: int, cursor: Optional[str] = None) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = self.client.get("/api/rounds", params=params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_cursor_walk_breaks_timestamp_ties(self) -> None:
+        pages: List[List[str]] = []
+        cursor: Optional[str] = None
+        while True:
+            body = self._page(limit=3, cursor=cursor)
+            pages.append([item["round_id"] for item in body["items"]])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        # Newest timestamp first, then highest id (insert order) first
+        order = sorted(
+            range(len(self.ROWS)),
+            key=lambda i: (self.ROWS[i][5], i),
+            reverse=True,
+        )
+        expected = [self.ROWS[i][0] for i in order]
+        self.assertEqual([len(page) for page in pages], [3, 3, 3, 1])
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_last_page_has_no_next_cursor(self) -> None:
+        first = self._page(limit=5)
+        self.assertIsNotNone(first["next_cursor"])
+
+        # The second page is exactly full, so one empty page ends the walk
+        second = self._page(limit=5, cursor=first["next_cursor"])
+        self.assertEqual(len(second["items"]), 5)
+        last = self._page(limit=5, cursor=second["next_cursor"])
+        self.assertEqual(last["items"], [])
+        self.assertIsNone(last["next_cursor"])
+
+        self.assertIsNone(self._page(limit=50)["next_cursor"])
+
+    def test_invalid_cursor_is_rejected(self) -> None:
+        for cursor in ("not base64!", "bm8tc2VwYXJhdG9y", "MjAyNnxub3QtYW4taW50"):
+            with self.subTest(cursor=cursor):
+                response = self.client.get("/api/rounds", params={"cursor": cursor})
+                self.assertEqual(response.status_code, 422)
+
+    def test_cursor_round_trip(self) -> None:
+        cursor = main.encode_cursor("2026-01-17 10:30:00", 42)
+        self.assertEqual(main.decode_cursor(cursor), ("2026-01-17 10:30:00", 42))
+
+
+if __name__ == "__main__":
+    unittest.main()
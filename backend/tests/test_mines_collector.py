@@ -0,0 +1,121 @@
+"""
+Mines collector write-path tests against a real SQLite database.
+
+The collector imports Playwright at module level, so these tests are skipped
+where the collector's browser dependency is not installed.
+"""
+
+import asyncio
+import importlib.util
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "collector"))
+
+HAS_PLAYWRIGHT = importlib.util.find_spec("playwright") is not None
+
+if HAS_PLAYWRIGHT:
+    from mines_collector import MinesCollector  # noqa: E402
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+@unittest.skipUnless(HAS_PLAYWRIGHT, "playwright is not installed")
+class WriterTest(unittest.IsolatedAsyncioTestCase):
+    """Queue -> writer task -> save_rounds pipeline."""
+
+    async def asyncSetUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = str(Path(tmp.name) / "mines.db")
+        self.collector = MinesCollector(db_path=self.db_path)
+
+    async def asyncTearDown(self) -> None:
+        await self.collector.close()
+
+    async def _start_writer(self) -> asyncio.Task:
+        await self.collector.init_db()
+        writer = asyncio.create_task(self.collector._writer_loop())
+        self.addAsyncCleanup(self._stop, writer)
+        return writer
+
+    @staticmethod
+    async def _stop(task: asyncio.Task) -> None:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def _drained(self) -> None:
+        await asyncio.wait_for(self.collector._write_queue.join(), timeout=5)
+
+    def _round_ids(self) -> List[str]:
+        with sqlite3.connect(self.db_path) as db:
+            return [
+                row[0] for row in
+                db.execute("SELECT round_id FROM mines_rounds ORDER BY round_id")
+            ]
+
+    async def test_shutdown_drains_queued_rounds(self) -> None:
+        collector = self.collector
+
+        async def queue_rounds(count: int) -> None:
+            for i in range(count):
+                collector.queue_round(f"q{i:04d}", 3, 2, 1.25, True)
+
+        # run() stops right after queueing; its shutdown must commit them all
+        collector.generate_test_data = queue_rounds
+        await asyncio.wait_for(collector.run(test_mode=True), timeout=10)
+
+        self.assertEqual(collector.rounds_collected, 1000)
+        self.assertEqual(len(self._round_ids()), 1000)
+
+    async def test_failed_batch_rolls_back_and_writer_continues(self) -> None:
+        writer = await self._start_writer()
+
+        # The second row cannot be bound, so executemany fails after the
+        # first row was already inserted into the open transaction
+        self.collector.queue_rounds([
+            ("bad0", 3, 1, 1.1, True),
+            ({"not": "bindable"}, 3, 1, 1.1, True),
+        ])
+        await self._drained()
+        self.assertEqual(self._round_ids(), [])
+
+        self.collector.queue_round("good", 3, 1, 1.1, True)
+        await self._drained()
+        self.assertFalse(writer.done())
+        self.assertEqual(self._round_ids(), ["good"])
+        self.assertEqual(self.collector.rounds_collected, 1)
+
+    async def test_duplicate_round_ids_are_ignored(self) -> None:
+        await self._start_writer()
+
+        self.collector.queue_rounds([
+            ("dup", 3, 1, 1.1, True),
+            ("dup", 5, 2, 2.2, True),
+            ("one", 2, 0, 0.0, False),
+        ])
+        await self._drained()
+        self.collector.queue_round("dup", 4, 4, 3.3, True)
+        await self._drained()
+
+        self.assertEqual(self._round_ids(), ["dup", "one"])
+        self.assertEqual(self.collector.rounds_collected, 2)
+        with sqlite3.connect(self.db_path) as db:
+            first = db.execute(
+                "SELECT mines_count, gems_revealed FROM mines_rounds WHERE round_id = 'dup'"
+            ).fetchone()
+        self.assertEqual(first, (3, 1))
+
+    async def test_invalid_round_is_not_queued(self) -> None:
+        self.assertFalse(self.collector.queue_round("bad", 0, 1, 1.0, True))
+        self.assertTrue(self.collector._write_queue.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()